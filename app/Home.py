@@ -46,7 +46,7 @@ if os.path.exists(results_file):
     with col3:
         st.metric("Status", "✓ Ready")
 else:
-    st.warning("⚠️ Run: python src/train.py first")
+    st.warning("⚠️ Run: python -m src.cli train first")
 
 st.markdown("---")
 
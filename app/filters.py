@@ -0,0 +1,86 @@
+# app/filters.py
+import os
+import sys
+import time
+
+import pandas as pd
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_loader import load_data, load_processed
+from src.preprocessing import clean_data
+from src.filter_index import (
+    build_filter_index, load_filter_index, query_filter_index, date_bounds, data_fingerprint
+)
+
+INDEX_PATH = "data/processed/"
+
+def load_crimes(processed_path, raw_path):
+    """
+    Cleaned crimes with Date parsed (processed store, else the raw export run
+    through clean_data) and the fingerprint their filter index is keyed on.
+    Call it from a page's cached loader so both are computed once, not on every rerun.
+    """
+    try:
+        df = load_processed(processed_path)
+    except (OSError, ValueError):
+        try:
+            df = clean_data(load_data(raw_path))
+        except (OSError, ValueError):
+            return None, None
+    return df, data_fingerprint(df)
+
+@st.cache_resource
+def get_filter_index(fingerprint, _df):
+    """Saved index from training when its fingerprint matches the loaded data, else built once"""
+    try:
+        index = load_filter_index(INDEX_PATH)
+        if index["fingerprint"] == fingerprint:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_filter_index(_df)
+
+def sidebar_filters(df, fingerprint):
+    """
+    Render date / crime type / district / arrest filters and return the matching rows.
+    `fingerprint` is data_fingerprint(df), computed once by the page's cached loader.
+    """
+    index = get_filter_index(fingerprint, df)
+    first, last = date_bounds(index)
+
+    st.sidebar.header("🔎 Filters")
+
+    date_range = ()
+    if first is not None:
+        date_range = st.sidebar.date_input(
+            "Date Range",
+            value=(first.date(), last.date()),
+            min_value=first.date(),
+            max_value=last.date()
+        )
+    crime_types = st.sidebar.multiselect("Crime Type", index["values"]["Primary Type"])
+    districts = st.sidebar.multiselect("District", index["values"]["District"])
+    arrest = st.sidebar.selectbox("Arrest Status", ["All", "Arrested", "Not Arrested"])
+
+    start = end = None
+    if len(date_range) == 2 and date_range != (first.date(), last.date()):
+        start = pd.Timestamp(date_range[0])
+        end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+
+    filters = {
+        "Primary Type": crime_types,
+        "District": districts,
+        "Arrest": {"All": [], "Arrested": ["True"], "Not Arrested": ["False"]}[arrest]
+    }
+
+    started = time.perf_counter()
+    positions = query_filter_index(index, filters, start, end)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    st.sidebar.caption(f"{len(positions):,} of {len(df):,} records · filtered in {elapsed_ms:.1f} ms")
+
+    if len(positions) == len(df):
+        return df
+    return df.iloc[positions]
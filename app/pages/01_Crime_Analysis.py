@@ -3,26 +3,31 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from filters import load_crimes, sidebar_filters
+
 st.set_page_config(page_title="Crime Analysis", page_icon="📊", layout="wide")
 
 st.title("📊 Crime Analysis Dashboard")
 
 @st.cache_data
 def load_data():
-    try:
-        return pd.read_csv("data/processed/crime_cleaned.csv")
-    except:
-        try:
-            return pd.read_csv("data/raw/chicago_crime.csv")
-        except:
-            return None
+    return load_crimes(
+        "data/processed/crime_cleaned.csv",
+        "data/raw/chicago_crime.csv"
+    )
 
-df = load_data()
+df, fingerprint = load_data()
 
 if df is None:
     st.error("❌ Data file not found")
     st.stop()
 
+df = sidebar_filters(df, fingerprint)
+
+if len(df) == 0:
+    st.warning("⚠️ No records match the selected filters")
+    st.stop()
+
 st.write(f"**Total Records:** {len(df):,}")
 
 # ====== Crime Type Distribution ======
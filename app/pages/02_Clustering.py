@@ -6,21 +6,20 @@ import plotly.graph_objects as go
 import json
 import numpy as np
 
+from filters import load_crimes, sidebar_filters
+
 st.set_page_config(page_title="Clustering", page_icon="🗺️", layout="wide")
 
 st.title("🗺️ Crime Clustering Analysis")
 
 @st.cache_data
 def load_data():
-    try:
-        return pd.read_csv("data/processed/crime_cleaned.csv")
-    except:
-        try:
-            return pd.read_csv("C:/Users/Dell/Documents/Project_PatrolQ/data/raw/Crimes_-_2001_to_Present_20251215.csv")
-        except:
-            return None
+    return load_crimes(
+        "data/processed/crime_cleaned.csv",
+        "C:/Users/Dell/Documents/Project_PatrolQ/data/raw/Crimes_-_2001_to_Present_20251215.csv"
+    )
 
-df = load_data()
+df, fingerprint = load_data()
 
 @st.cache_data
 def load_results():
@@ -33,13 +32,19 @@ def load_results():
 results = load_results()
 
 if results is None:
-    st.error("❌ Please run: python src/train.py")
+    st.error("❌ Please run: python -m src.cli train")
     st.stop()
 
 if df is None:
     st.error("❌ Data file not found")
     st.stop()
 
+df = sidebar_filters(df, fingerprint)
+
+if len(df) == 0:
+    st.warning("⚠️ No records match the selected filters")
+    st.stop()
+
 # ====== KMeans Performance ======
 st.subheader("K-Means Performance Analysis")
 
@@ -94,6 +99,46 @@ with col3:
 
 st.success(f"**K={best_k}** selected as best model with silhouette score of **{best_score:.4f}**")
 
+# ====== Cluster Stability ======
+@st.cache_data
+def load_stability():
+    try:
+        with open("outputs/stability_results.json", 'r') as f:
+            return json.load(f)
+    except:
+        return None
+
+stability = load_stability()
+
+if stability is not None:
+    st.subheader("🔁 Cluster Stability (Bootstrap)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = px.histogram(
+            x=stability['ari_values'],
+            nbins=30,
+            title=f"Adjusted Rand Index over {stability['n_bootstrap']} Bootstrap Replicates",
+            labels={"x": "Adjusted Rand Index", "y": "Replicates"},
+            color_discrete_sequence=['#2ca02c']
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        clusters = stability['clusters']
+        fig = px.bar(
+            x=[f"Cluster {c['cluster'] + 1}" for c in clusters],
+            y=[c['jaccard_mean'] for c in clusters],
+            title="Per-Cluster Stability (Mean Jaccard)",
+            labels={"x": "Cluster", "y": "Mean Jaccard"},
+            color=[c['jaccard_mean'] for c in clusters],
+            color_continuous_scale="Greens"
+        )
+        fig.add_hline(y=0.75, line_dash="dash", line_color="red",
+                       annotation_text="Stable (0.75)")
+        st.plotly_chart(fig, use_container_width=True)
+
 # ====== Geographic Visualization ======
 st.subheader("📍 Geographic Crime Distribution")
 
@@ -117,22 +162,113 @@ st.plotly_chart(fig, use_container_width=True)
 # ====== Cluster Details ======
 st.subheader("Cluster Details")
 
-cluster_info = {
-    "Cluster 1": {"crimes": 8500, "type": "Downtown/Theft", "peak": "9 AM - 5 PM"},
-    "Cluster 2": {"crimes": 12000, "type": "South Side/Violence", "peak": "6 PM - 2 AM"},
-    "Cluster 3": {"crimes": 10500, "type": "West Side/Motor Theft", "peak": "11 PM - 3 AM"},
-    "Cluster 4": {"crimes": 9200, "type": "North Side/Domestic", "peak": "Variable"},
-    "Cluster 5": {"crimes": 9800, "type": "Outer/Mixed", "peak": "Variable"}
-}
-
-for cluster_name, info in cluster_info.items():
-    with st.expander(f"📍 {cluster_name}: {info['type']}"):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Crimes", f"{info['crimes']:,}")
-        with col2:
-            st.metric("Dominant Type", info['type'].split('/')[1])
-        with col3:
-            st.metric("Peak Hours", info['peak'])
+@st.cache_data
+def load_profiles():
+    try:
+        with open("outputs/cluster_profiles.json", 'r') as f:
+            return json.load(f)
+    except:
+        return None
+
+profiles = load_profiles()
+
+if profiles is None:
+    st.warning("⚠️ Cluster profiles not found. Run: python -m src.cli train")
+else:
+    for profile in profiles:
+        dominant = profile['dominant_types'][0]['type'] if profile['dominant_types'] else "N/A"
+        with st.expander(f"📍 Cluster {profile['cluster'] + 1}: {dominant}"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Crimes", f"{profile['crimes']:,}")
+            with col2:
+                st.metric("Dominant Type", dominant)
+            with col3:
+                st.metric("Peak Hours", profile['peak_window'])
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Arrest Rate", f"{profile['arrest_rate']:.1%}")
+            with col2:
+                st.metric("Domestic Rate", f"{profile['domestic_rate']:.1%}")
+            with col3:
+                centroid = profile['centroid']
+                st.metric("Centroid", f"{centroid['latitude']:.4f}, {centroid['longitude']:.4f}")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = px.bar(
+                    x=list(range(24)),
+                    y=profile['hour_histogram'],
+                    title="Crimes by Hour of Day",
+                    labels={"x": "Hour", "y": "Crimes"},
+                    color_discrete_sequence=['#FF6B6B']
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            with col2:
+                st.dataframe(
+                    pd.DataFrame(profile['dominant_types']).rename(
+                        columns={"type": "Crime Type", "count": "Count", "share": "Share"}
+                    ),
+                    use_container_width=True
+                )
+
+# ====== Hotspot Drift ======
+@st.cache_data
+def load_drift():
+    try:
+        with open("outputs/hotspot_drift.json", 'r') as f:
+            return json.load(f)
+    except:
+        return None
+
+drift = load_drift()
+
+if drift is not None:
+    st.subheader("🧭 Hotspot Drift")
+    st.caption(f"{drift['window_days']}-day windows stepped every {drift['step_days']} days "
+               f"({drift['n_windows']} windows)")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Windows", drift['n_windows'])
+    with col2:
+        st.metric("Hotspot Births", drift['summary']['births'])
+    with col3:
+        st.metric("Hotspot Deaths", drift['summary']['deaths'])
+
+    tracks = pd.DataFrame(drift['tracks'])
+    if len(tracks):
+        tracks['Hotspot'] = "Track " + tracks['track_id'].astype(str)
+
+        fig = px.line(
+            tracks,
+            x='longitude',
+            y='latitude',
+            color='Hotspot',
+            hover_data=['window_end', 'crimes'],
+            title="Centroid Tracks",
+            labels={"longitude": "Longitude", "latitude": "Latitude"}
+        )
+        events = pd.DataFrame(drift['events']).dropna(subset=['latitude'])
+        for event, symbol in [("birth", "star"), ("death", "x")]:
+            points = events[events['event'] == event]
+            fig.add_trace(go.Scatter(
+                x=points['longitude'],
+                y=points['latitude'],
+                mode='markers',
+                name=event.title(),
+                marker=dict(symbol=symbol, size=12, color='black'),
+                text=points['window_end']
+            ))
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.dataframe(
+            pd.DataFrame(drift['summary']['tracks']).rename(columns={
+                "track_id": "Track", "first_window": "First Window", "last_window": "Last Window",
+                "windows": "Windows", "net_drift_km": "Net Drift (km)", "path_length_km": "Path Length (km)"
+            }),
+            use_container_width=True
+        )
 
 st.success("✅ Clustering analysis loaded successfully!")
\ No newline at end of file
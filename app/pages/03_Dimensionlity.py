@@ -28,7 +28,7 @@ pca_results = load_pca_results()
 clustering_results = load_clustering_results()
 
 if pca_results is None:
-    st.error("❌ Please run: python src/train.py")
+    st.error("❌ Please run: python -m src.cli train")
     st.stop()
 
 # ====== PCA Results ======
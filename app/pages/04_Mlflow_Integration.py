@@ -2,6 +2,8 @@
 import streamlit as st
 import json
 import pandas as pd
+import plotly.express as px
+from mlflow.tracking import MlflowClient
 
 st.set_page_config(page_title="MLflow", page_icon="📊", layout="wide")
 
@@ -11,6 +13,86 @@ st.info("""
 MLflow tracks all model experiments, parameters, and metrics for reproducibility and versioning.
 """)
 
+EXPERIMENT_NAME = "Chicago Crime Clustering"
+MODEL_NAME = "chicago-crime-kmeans"
+
+# Tracking-store queries are cached for CACHE_TTL seconds so reruns don't hit the store
+CACHE_TTL = 300
+ALGORITHMS = ["All", "kmeans", "kmeans_bootstrap", "dbscan", "hierarchical"]
+ORDER_BY = {
+    "Newest first": "attributes.start_time DESC",
+    "Best silhouette": "metrics.silhouette_score DESC",
+    "Worst silhouette": "metrics.silhouette_score ASC"
+}
+
+@st.cache_resource
+def get_client():
+    return MlflowClient()
+
+@st.cache_data(ttl=CACHE_TTL)
+def get_experiment_id(name):
+    experiment = get_client().get_experiment_by_name(name)
+    return None if experiment is None else experiment.experiment_id
+
+@st.cache_data(ttl=CACHE_TTL)
+def search_runs_page(experiment_id, filter_string, order_by, page_size, page_token):
+    """One page of runs, filtered and ordered by the tracking server"""
+    runs = get_client().search_runs(
+        experiment_ids=[experiment_id],
+        filter_string=filter_string,
+        order_by=[order_by],
+        max_results=page_size,
+        page_token=page_token
+    )
+    rows = [
+        {
+            "run_id": run.info.run_id,
+            "run_name": run.info.run_name,
+            "status": run.info.status,
+            "start_time": pd.to_datetime(run.info.start_time, unit="ms"),
+            "params": dict(run.data.params),
+            "metrics": dict(run.data.metrics)
+        }
+        for run in runs
+    ]
+    return rows, runs.token
+
+@st.cache_data(ttl=CACHE_TTL)
+def load_metric_history(run_id, key):
+    history = get_client().get_metric_history(run_id, key)
+    return pd.DataFrame(
+        [{"step": m.step, "value": m.value, "timestamp": pd.to_datetime(m.timestamp, unit="ms")} for m in history]
+    )
+
+@st.cache_data(ttl=CACHE_TTL)
+def load_model_versions(name):
+    versions = get_client().search_model_versions(f"name='{name}'")
+    return sorted(
+        [
+            {
+                "version": int(v.version),
+                "stage": v.current_stage,
+                "status": v.status,
+                "run_id": v.run_id,
+                "created_at": pd.to_datetime(v.creation_timestamp, unit="ms"),
+                "updated_at": pd.to_datetime(v.last_updated_timestamp, unit="ms")
+            }
+            for v in versions
+        ],
+        key=lambda v: v["version"],
+        reverse=True
+    )
+
+@st.cache_data(ttl=CACHE_TTL)
+def get_run(run_id):
+    """Params and metrics logged by one run"""
+    run = get_client().get_run(run_id)
+    return {
+        "run_name": run.info.run_name,
+        "params": dict(run.data.params),
+        "metrics": dict(run.data.metrics)
+    }
+
 @st.cache_data
 def load_results():
     try:
@@ -22,9 +104,18 @@ def load_results():
 results = load_results()
 
 if results is None:
-    st.error("❌ Please run: python src/train.py")
+    st.error("❌ Please run: python -m src.cli train")
     st.stop()
 
+try:
+    versions = load_model_versions(MODEL_NAME)
+    registry_error = None
+except Exception as e:
+    versions = []
+    registry_error = e
+
+latest = versions[0] if versions else None
+
 # ====== All Experiments ======
 st.subheader("All KMeans Experiments")
 
@@ -38,7 +129,7 @@ st.dataframe(
 )
 
 # ====== Best Model ======
-st.subheader("🏆 Best Model - Production Ready")
+st.subheader("🏆 Best Model")
 
 best = results['best_kmeans']
 
@@ -51,30 +142,130 @@ with col2:
     st.metric("Silhouette Score", f"{best['silhouette_score']:.4f}")
 
 with col3:
-    st.metric("Status", "✓ Registered")
+    st.metric("Registry Stage", latest["stage"] if latest else "Not registered")
+
+if latest is None:
+    st.info(f"Model with K={best['k']} is not registered in MLflow yet")
+elif latest["stage"] in ("None", "", None):
+    st.success(f"✓ Version {latest['version']} of {MODEL_NAME} registered in MLflow (no stage assigned)")
+else:
+    st.success(f"✓ Version {latest['version']} of {MODEL_NAME} registered in MLflow, stage: {latest['stage']}")
+
+# ====== Tracked Runs ======
+st.subheader("🔍 Tracked Runs")
 
-st.success(f"✓ Model with K={best['k']} registered in MLflow as production model")
+try:
+    experiment_id = get_experiment_id(EXPERIMENT_NAME)
+except Exception as e:
+    experiment_id = None
+    st.warning(f"⚠️ Could not reach the MLflow tracking store: {e}")
+
+if experiment_id is None:
+    st.warning(f"⚠️ No MLflow experiment named '{EXPERIMENT_NAME}' yet. Run: python -m src.cli train")
+else:
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        algorithm = st.selectbox("Algorithm", ALGORITHMS)
+    with col2:
+        min_silhouette = st.number_input("Min Silhouette", value=-1.0, min_value=-1.0, max_value=1.0, step=0.05)
+    with col3:
+        order_label = st.selectbox("Order By", list(ORDER_BY))
+    with col4:
+        page_size = st.selectbox("Runs per Page", [10, 25, 50, 100], index=1)
+
+    filters = []
+    if algorithm != "All":
+        filters.append(f"params.algorithm = '{algorithm}'")
+    if min_silhouette > -1.0:
+        filters.append(f"metrics.silhouette_score >= {min_silhouette}")
+    filter_string = " and ".join(filters)
+
+    # Page tokens are kept per query; changing any filter restarts at page 1
+    query = (filter_string, order_label, page_size)
+    if st.session_state.get("runs_query") != query:
+        st.session_state["runs_query"] = query
+        st.session_state["page_tokens"] = [None]
+
+    tokens = st.session_state["page_tokens"]
+    page = len(tokens) - 1
+    runs, next_token = search_runs_page(experiment_id, filter_string, ORDER_BY[order_label], page_size, tokens[-1])
+
+    if runs:
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "run_name": run["run_name"],
+                    "algorithm": run["params"].get("algorithm"),
+                    "status": run["status"],
+                    "start_time": run["start_time"],
+                    **run["metrics"]
+                }
+                for run in runs
+            ]),
+            use_container_width=True
+        )
+    else:
+        st.info("No runs match these filters.")
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        if st.button("⬅️ Previous", disabled=page == 0):
+            tokens.pop()
+            st.experimental_rerun()
+    with col2:
+        if st.button("Next ➡️", disabled=not next_token):
+            tokens.append(next_token)
+            st.experimental_rerun()
+    with col3:
+        st.caption(f"Page {page + 1} · {len(runs)} runs shown")
+
+    # Metric histories are only fetched for runs the user asks to inspect
+    for run in runs:
+        with st.expander(f"{run['run_name']} · {run['params'].get('algorithm', 'n/a')}"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.json({"run_id": run["run_id"], "params": run["params"]})
+            with col2:
+                st.json(run["metrics"])
+
+            if run["metrics"] and st.checkbox("Load metric history", key=f"history_{run['run_id']}"):
+                for key in run["metrics"]:
+                    history = load_metric_history(run["run_id"], key)
+                    if len(history) > 1:
+                        fig = px.line(history, x="step", y="value", markers=True, title=key)
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.write(f"**{key}:** {history['value'].iloc[-1]:.4f}")
 
 # ====== Model Registry ======
 st.subheader("Model Registry Information")
 
-st.json({
-    "model_name": "chicago-crime-kmeans",
-    "version": "1.0",
-    "status": "Production",
-    "algorithm": "KMeans",
-    "parameters": {
-        "n_clusters": best['k'],
-        "random_state": 42,
-        "n_init": 10
-    },
-    "metrics": {
-        "silhouette_score": best['silhouette_score'],
-        "davies_bouldin_score": kmeans_data[best['k']-3]['davies_bouldin_score']
-    },
-    "created_at": "2026-01-20",
-    "updated_at": "2026-01-20"
-})
+if registry_error is not None:
+    st.warning(f"⚠️ Could not query the model registry: {registry_error}")
+
+if latest is not None:
+    # Parameters and metrics come from the run that produced this version
+    try:
+        run = get_run(latest["run_id"])
+    except Exception as e:
+        run = {"params": {}, "metrics": {}}
+        st.warning(f"⚠️ Could not load run {latest['run_id']}: {e}")
+
+    st.json({
+        "model_name": MODEL_NAME,
+        "version": latest["version"],
+        "status": latest["stage"],
+        "algorithm": run["params"].get("algorithm"),
+        "parameters": {key: value for key, value in run["params"].items() if key != "algorithm"},
+        "metrics": run["metrics"],
+        "run_id": latest["run_id"],
+        "created_at": str(latest["created_at"]),
+        "updated_at": str(latest["updated_at"])
+    })
+
+    st.dataframe(pd.DataFrame(versions), use_container_width=True)
+else:
+    st.info(f"No registered versions of '{MODEL_NAME}' yet.")
 
 # ====== How to Use MLflow UI ======
 st.subheader("View Full MLflow Dashboard")
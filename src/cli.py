@@ -0,0 +1,212 @@
+# src/cli.py
+"""
+PatrolIQ command line interface.
+
+    python -m src.cli ingest    [--input RAW.csv] [--output CLEAN.csv] [--workers N]
+    python -m src.cli train     [--input RAW.csv | --from-processed] [--workers N]
+    python -m src.cli score     --input RAW.csv [--output SCORED.csv] [--model-uri URI]
+    python -m src.cli benchmark {patrol,ingest,imports}
+
+Only the standard library is imported at module level. pandas, sklearn and
+mlflow are imported inside the subcommands that need them, and each
+subcommand logs how long its imports took.
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+_STARTED = time.perf_counter()
+
+DEFAULT_MODEL_URI = "models:/chicago-crime-kmeans/latest"
+
+# Modules timed by `benchmark imports`, each in a fresh interpreter
+BENCHMARK_IMPORTS = ["numpy", "pandas", "scipy.sparse", "sklearn.cluster", "mlflow", "src.train"]
+
+logger = logging.getLogger("src.cli")
+_import_times = {}
+
+
+@contextmanager
+def timed_import(label):
+    """Record how long the imports inside the block take"""
+    start = time.perf_counter()
+    yield
+    _import_times[label] = time.perf_counter() - start
+
+
+def setup_logging(log_to_file=False):
+    handlers = [logging.StreamHandler()]
+    if log_to_file:
+        os.makedirs("logs", exist_ok=True)
+        log_filename = f"logs/training_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        handlers.append(logging.FileHandler(log_filename))
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+
+def _save_benchmark(name, results):
+    os.makedirs("outputs", exist_ok=True)
+    output_file = f"outputs/benchmark_{name}.json"
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=4)
+    logger.info(f"✓ Benchmark results saved to {output_file}")
+
+
+# ==================== COMMANDS ====================
+
+def cmd_ingest(args):
+    with timed_import("pandas + src.data_loader"):
+        from src.data_loader import RAW_DATA_PATH, load_data, save_processed, parallel_ingest
+        from src.preprocessing import clean_data
+
+    args.input = args.input or RAW_DATA_PATH
+    if args.workers > 1:
+        parallel_ingest(args.input, args.output, n_workers=args.workers)
+    else:
+        df = clean_data(load_data(args.input))
+        save_processed(df, args.output)
+        logger.info(f"✓ {len(df):,} cleaned rows saved to {args.output}")
+
+
+def cmd_train(args):
+    with timed_import("src.train (mlflow, sklearn, pandas)"):
+        from src.data_loader import RAW_DATA_PATH, PROCESSED_DATA_PATH
+        from src.train import run_pipeline
+
+    from_processed = args.from_processed
+    if args.input is None and not from_processed and not os.path.exists(RAW_DATA_PATH):
+        if not os.path.exists(PROCESSED_DATA_PATH):
+            raise SystemExit(f"No raw data at {RAW_DATA_PATH} and no processed store at "
+                             f"{PROCESSED_DATA_PATH}: pass --input RAW.csv or run `ingest` first")
+        logger.info(f"No raw data at {RAW_DATA_PATH}; training from {PROCESSED_DATA_PATH}")
+        from_processed = True
+
+    run_pipeline(
+        raw_path=args.input or RAW_DATA_PATH,
+        ingest_workers=args.workers,
+        from_processed=from_processed
+    )
+
+
+def cmd_score(args):
+    with timed_import("mlflow.sklearn + pandas"):
+        import mlflow.sklearn
+        from src.data_loader import load_data, save_processed
+        from src.preprocessing import clean_data
+        from src.features import select_features
+
+    os.environ["GIT_PYTHON_REFRESH"] = "quiet"
+    model = mlflow.sklearn.load_model(args.model_uri)
+    logger.info(f"✓ Loaded model {args.model_uri}")
+
+    df = clean_data(load_data(args.input))
+    df["Cluster"] = model.predict(select_features(df))
+    save_processed(df, args.output)
+
+    logger.info(f"✓ Scored {len(df):,} rows → {args.output}")
+    logger.info(f"✓ Cluster sizes: {df['Cluster'].value_counts().sort_index().to_dict()}")
+
+
+def cmd_benchmark(args):
+    if args.target == "patrol":
+        with timed_import("numpy + scipy + src.patrol"):
+            from src.patrol import benchmark_allocation, benchmark_scaling
+
+        _save_benchmark("patrol", {
+            "exact_comparison": benchmark_allocation(),
+            "scaling": benchmark_scaling()
+        })
+
+    elif args.target == "ingest":
+        with timed_import("pandas + src.data_loader"):
+            from src.data_loader import RAW_DATA_PATH, parallel_ingest
+
+        args.input = args.input or RAW_DATA_PATH
+        results = []
+        for workers in args.workers:
+            stats = parallel_ingest(args.input, args.output, n_workers=workers)
+            results.append(stats)
+        base = results[0]["rows_per_sec"]
+        for stats in results:
+            stats["speedup"] = stats["rows_per_sec"] / base
+            logger.info(f"✓ {stats['workers']} workers: {stats['rows_per_sec']:,.0f} rows/s "
+                        f"({stats['speedup']:.2f}x)")
+        _save_benchmark("ingest", results)
+
+    elif args.target == "imports":
+        results = {}
+        for module in BENCHMARK_IMPORTS + ["src.cli --help"]:
+            if module.endswith("--help"):
+                code = "import runpy, sys; sys.argv = ['cli', '--help']\n" \
+                       "try: runpy.run_module('src.cli', run_name='__main__')\n" \
+                       "except SystemExit: pass"
+            else:
+                code = f"import {module}"
+            timer = f"import time; t = time.perf_counter()\n{code}\nprint(time.perf_counter() - t)"
+            out = subprocess.run([sys.executable, "-c", timer], capture_output=True, text=True, check=True)
+            results[module] = float(out.stdout.strip().splitlines()[-1])
+            logger.info(f"✓ {module}: {results[module]:.3f}s")
+        _save_benchmark("imports", results)
+
+
+# ==================== ENTRY POINT ====================
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="patroliq", description="PatrolIQ crime analytics pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser("ingest", help="Load + clean the raw CSV into the processed store")
+    ingest.add_argument("--input", default=None, help="Raw Chicago crimes CSV (default: RAW_DATA_PATH)")
+    ingest.add_argument("--output", default="data/processed/crime_cleaned.csv")
+    ingest.add_argument("--workers", type=int, default=1, help="Worker processes (>1 = parallel ingest)")
+    ingest.set_defaults(func=cmd_ingest)
+
+    train = subparsers.add_parser("train", help="Run the full clustering pipeline")
+    source = train.add_mutually_exclusive_group()
+    source.add_argument("--input", default=None, help="Raw Chicago crimes CSV to ingest (default: RAW_DATA_PATH)")
+    source.add_argument("--from-processed", action="store_true",
+                        help="Skip ingest and train on the processed store written by `ingest`")
+    train.add_argument("--workers", type=int, default=1, help="Worker processes for the ingest step")
+    train.set_defaults(func=cmd_train)
+
+    score = subparsers.add_parser("score", help="Assign clusters to a raw CSV with the registered model")
+    score.add_argument("--input", required=True, help="Raw Chicago crimes CSV to score")
+    score.add_argument("--output", default="outputs/scored.csv")
+    score.add_argument("--model-uri", default=DEFAULT_MODEL_URI)
+    score.set_defaults(func=cmd_score)
+
+    benchmark = subparsers.add_parser("benchmark", help="Run performance benchmarks")
+    benchmark.add_argument("target", choices=["patrol", "ingest", "imports"])
+    benchmark.add_argument("--input", default=None, help="Raw CSV (ingest benchmark)")
+    benchmark.add_argument("--output", default="data/processed/benchmark_ingest.csv")
+    benchmark.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                           help="Worker counts to compare (ingest benchmark)")
+    benchmark.set_defaults(func=cmd_benchmark)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logging(log_to_file=args.command == "train")
+
+    dispatched = time.perf_counter()
+    args.func(args)
+
+    imports = ", ".join(f"{label} {seconds:.2f}s" for label, seconds in _import_times.items())
+    logger.info(f"⏱ Startup {dispatched - _STARTED:.2f}s; imports: {imports or 'none'}; "
+                f"total {time.perf_counter() - _STARTED:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
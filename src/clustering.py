@@ -1,9 +1,13 @@
-from sklearn.cluster import KMeans, DBSCAN
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from sklearn.cluster import KMeans, DBSCAN, OPTICS, cluster_optics_dbscan
 from sklearn.metrics import silhouette_score
+from sklearn.neighbors import NearestNeighbors
 
-def kmeans_cluster(X, k=5):
+def kmeans_fit(X, k=5):
     """
-    Apply KMeans clustering and return labels & silhouette score
+    Fit KMeans and return the model
     """
 
     model = KMeans(
@@ -12,21 +16,111 @@ def kmeans_cluster(X, k=5):
         n_init=10
     )
 
-    labels = model.fit_predict(X)
+    return model.fit(X)
+
+
+def kmeans_cluster(X, k=5):
+    """
+    Apply KMeans clustering and return labels & silhouette score
+    """
+
+    labels = kmeans_fit(X, k).labels_
     score = silhouette_score(X, labels)
 
     return labels, score
 
 
-def dbscan_cluster(X):
+def dbscan_cluster(X, eps=0.01, min_samples=50):
     """
     Apply DBSCAN clustering
     """
 
     model = DBSCAN(
-        eps=0.01,
-        min_samples=50
+        eps=eps,
+        min_samples=min_samples
     )
 
     labels = model.fit_predict(X)
     return labels
+
+
+def radius_neighbor_graph(X, max_eps):
+    """
+    Sparse distance graph of all pairs within `max_eps` (self excluded).
+    Computed once and reused for every eps <= max_eps.
+    """
+    nn = NearestNeighbors(radius=max_eps).fit(X)
+    graph = nn.radius_neighbors_graph(mode="distance").tocoo()
+    return graph.row, graph.col, graph.data, X.shape[0]
+
+
+def dbscan_from_graph(graph, eps, min_samples):
+    """
+    Derive DBSCAN labels for one (eps, min_samples) pair from a cached
+    radius-neighbour graph. Core points are connected through core-core
+    edges; border points join the cluster of a neighbouring core point.
+    """
+    rows, cols, dists, n = graph
+    within = dists <= eps
+
+    # min_samples counts the point itself, like sklearn's DBSCAN
+    degree = np.bincount(rows[within], minlength=n) + 1
+    core = degree >= min_samples
+
+    labels = np.full(n, -1, dtype=np.int64)
+    if not core.any():
+        return labels
+
+    core_edges = within & core[rows] & core[cols]
+    adjacency = sparse.csr_matrix(
+        (np.ones(core_edges.sum(), dtype=np.int8), (rows[core_edges], cols[core_edges])),
+        shape=(n, n)
+    )
+    _, components = connected_components(adjacency, directed=False)
+    _, labels[core] = np.unique(components[core], return_inverse=True)
+
+    border_edges = within & ~core[rows] & core[cols]
+    labels[rows[border_edges]] = labels[cols[border_edges]]
+
+    return labels
+
+
+def dbscan_sweep(X, eps_values, min_samples_values, method="graph"):
+    """
+    DBSCAN labels for every (eps, min_samples) pair at roughly the cost of one fit.
+
+    method="graph": build the radius-neighbour graph once for max(eps_values)
+                    and threshold it for every configuration.
+    method="optics": fit OPTICS once per min_samples (max_eps=max(eps_values))
+                     and extract DBSCAN labels for each eps from its reachability.
+    """
+    print(f"Running DBSCAN sweep over {len(eps_values)} eps × "
+          f"{len(min_samples_values)} min_samples values ({method})...")
+
+    max_eps = max(eps_values)
+    sweep = []
+
+    if method == "graph":
+        graph = radius_neighbor_graph(X, max_eps)
+        print(f"✓ Neighbour graph cached: {len(graph[0]):,} edges within eps={max_eps}")
+        for eps in eps_values:
+            for min_samples in min_samples_values:
+                sweep.append((eps, min_samples, dbscan_from_graph(graph, eps, min_samples)))
+
+    elif method == "optics":
+        for min_samples in min_samples_values:
+            optics = OPTICS(min_samples=min_samples, max_eps=max_eps).fit(X)
+            for eps in eps_values:
+                labels = cluster_optics_dbscan(
+                    reachability=optics.reachability_,
+                    core_distances=optics.core_distances_,
+                    ordering=optics.ordering_,
+                    eps=eps
+                )
+                sweep.append((eps, min_samples, labels))
+
+    else:
+        raise ValueError(f"Unknown DBSCAN sweep method: {method}")
+
+    print(f"✓ DBSCAN sweep completed: {len(sweep)} configurations")
+    return sweep
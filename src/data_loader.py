@@ -1,7 +1,152 @@
+import io
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 
-def load_data(path):
+from src.preprocessing import clean_data
+
+RAW_DATA_PATH = "C:/Users/Dell/Documents/Project_PatrolQ/data/raw/Crimes_-_2001_to_Present_20251215.csv"
+PROCESSED_DATA_PATH = "data/processed/crime_cleaned.csv"
+
+# Pinned column dtypes so every chunk of the file parses identically,
+# whichever rows it happens to contain (e.g. Ward with or without missing values)
+CSV_DTYPES = {
+    "ID": "Int64",
+    "Case Number": str,
+    "Date": str,
+    "Block": str,
+    "IUCR": str,
+    "Primary Type": str,
+    "Description": str,
+    "Location Description": str,
+    "Arrest": bool,
+    "Domestic": bool,
+    "Beat": "Int64",
+    "District": "Int64",
+    "Ward": "Int64",
+    "Community Area": "Int64",
+    "FBI Code": str,
+    "X Coordinate": float,
+    "Y Coordinate": float,
+    "Year": "Int64",
+    "Updated On": str,
+    "Latitude": float,
+    "Longitude": float,
+    "Location": str
+}
+PROCESSED_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def load_data(path=RAW_DATA_PATH):
     """Load Chicago crime data from CSV"""
-    print(f"Loading data from C:/Users/Dell/Documents/Project_PatrolQ/data/raw...")
-    df = pd.read_csv("C:/Users/Dell/Documents/Project_PatrolQ/data/raw/Crimes_-_2001_to_Present_20251215.csv")
-    return df
\ No newline at end of file
+    print(f"Loading data from {path}...")
+    df = pd.read_csv(path, dtype=CSV_DTYPES)
+    return df
+
+
+def save_processed(df, path=PROCESSED_DATA_PATH, header=True):
+    """Write cleaned data to the processed store"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    df.to_csv(path, index=False, header=header, date_format=PROCESSED_DATE_FORMAT)
+
+
+def load_processed(path=PROCESSED_DATA_PATH):
+    """Load cleaned data written by save_processed / parallel_ingest"""
+    df = pd.read_csv(path, dtype=CSV_DTYPES)
+    df["Date"] = pd.to_datetime(df["Date"], format=PROCESSED_DATE_FORMAT)
+    return df
+
+
+def _line_aligned_ranges(path, chunk_bytes):
+    """Split the data section of a CSV into byte ranges that start on line boundaries"""
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        header = f.readline()
+        bounds = [f.tell()]
+
+        while bounds[-1] + chunk_bytes < size:
+            f.seek(bounds[-1] + chunk_bytes)
+            f.readline()
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+
+    columns = pd.read_csv(io.BytesIO(header), nrows=0).columns.tolist()
+    return columns, list(zip(bounds, bounds[1:] + [size]))
+
+
+def _ingest_range(path, start, end, columns, part_path, header):
+    """Worker: parse, clean and write one byte range straight to a part file"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    df = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=CSV_DTYPES)
+    n_raw = len(df)
+
+    df = clean_data(df)
+    save_processed(df, part_path, header=header)
+
+    return n_raw, len(df)
+
+
+def parallel_ingest(path=RAW_DATA_PATH, output_path=PROCESSED_DATA_PATH,
+                    n_workers=None, chunk_bytes=64 * 1024 ** 2):
+    """
+    Multi-process load + clean of the raw CSV.
+
+    The file is split into line-aligned byte ranges; each worker process reads
+    its range, runs clean_data and writes its part of the processed CSV itself,
+    so no parsed data is sent back to the parent. Parts are then concatenated
+    in order, giving the same file as load_data + clean_data + save_processed.
+
+    Assumes no quoted field in the raw file contains a newline (true for the
+    Chicago crimes export).
+
+    Workers are always started with the "spawn" method, as on Windows, so every
+    platform re-imports the caller's main module in the workers: entry points
+    must keep their pipeline under `if __name__ == "__main__":` (src.cli,
+    src.train do).
+    """
+    n_workers = n_workers or os.cpu_count()
+    start_time = time.perf_counter()
+
+    columns, ranges = _line_aligned_ranges(path, chunk_bytes)
+    print(f"Ingesting {path} with {n_workers} workers ({len(ranges)} chunks)...")
+
+    parts_dir = output_path + ".parts"
+    os.makedirs(parts_dir, exist_ok=True)
+    part_paths = [os.path.join(parts_dir, f"part-{i:05d}.csv") for i in range(len(ranges))]
+
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=spawn) as executor:
+        futures = [
+            executor.submit(_ingest_range, path, start, end, columns, part_path, i == 0)
+            for i, ((start, end), part_path) in enumerate(zip(ranges, part_paths))
+        ]
+        counts = [future.result() for future in futures]
+
+    with open(output_path, 'wb') as out:
+        for part_path in part_paths:
+            with open(part_path, 'rb') as part:
+                shutil.copyfileobj(part, out)
+    shutil.rmtree(parts_dir)
+
+    n_raw = sum(raw for raw, _ in counts)
+    n_clean = sum(clean for _, clean in counts)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"✓ Ingested {n_raw:,} rows → {n_clean:,} clean rows in {elapsed:.1f}s "
+          f"({n_raw / elapsed:,.0f} rows/s)")
+    return {
+        "raw_rows": n_raw,
+        "clean_rows": n_clean,
+        "chunks": len(ranges),
+        "workers": n_workers,
+        "seconds": elapsed,
+        "rows_per_sec": n_raw / elapsed
+    }
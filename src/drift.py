@@ -0,0 +1,281 @@
+# src/drift.py
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+
+# Local equirectangular projection around Chicago (km per degree)
+ORIGIN_LAT, ORIGIN_LON = 41.85, -87.65
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON = 111.320 * np.cos(np.radians(ORIGIN_LAT))
+
+
+def _to_km(lat, lon):
+    return np.column_stack([
+        (np.asarray(lon, dtype=float) - ORIGIN_LON) * KM_PER_DEG_LON,
+        (np.asarray(lat, dtype=float) - ORIGIN_LAT) * KM_PER_DEG_LAT
+    ])
+
+
+def _to_latlon(points):
+    return points[:, 1] / KM_PER_DEG_LAT + ORIGIN_LAT, points[:, 0] / KM_PER_DEG_LON + ORIGIN_LON
+
+
+class _WindowState:
+    """
+    Running K-Means sufficient statistics (per-slot coordinate sums and counts)
+    for the current window. Slots are never reused, so a slot index doubles
+    as the hotspot's track id.
+    """
+
+    def __init__(self, points):
+        self.points = points
+        self.labels = np.full(len(points), -1, dtype=np.int64)
+        self.sums = np.zeros((0, 2))
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.alive = np.zeros(0, dtype=bool)
+
+    @property
+    def centroids(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sums / self.counts[:, None]
+
+    def nearest(self, rows):
+        """Nearest live, non-empty centroid and its squared distance for a slice of points"""
+        # Dead slots are never reused and empty ones have no centroid (0 / 0),
+        # so distances are only computed to the usable slots
+        usable = np.flatnonzero(self.alive & (self.counts > 0))
+        centroids = self.sums[usable] / self.counts[usable, None]
+        diff = self.points[rows][:, None, :] - centroids[None, :, :]
+        dist = np.einsum("ijk,ijk->ij", diff, diff)
+        nearest = np.argmin(dist, axis=1)
+        return usable[nearest], dist[np.arange(len(nearest)), nearest]
+
+    def add(self, rows, labels):
+        self.labels[rows] = labels
+        n_slots = len(self.counts)
+        self.sums += np.column_stack([
+            np.bincount(labels, weights=self.points[rows, 0], minlength=n_slots),
+            np.bincount(labels, weights=self.points[rows, 1], minlength=n_slots)
+        ])
+        self.counts += np.bincount(labels, minlength=n_slots)
+
+    def remove(self, rows):
+        labels = self.labels[rows]
+        assigned = labels >= 0
+        labels = labels[assigned]
+        n_slots = len(self.counts)
+        self.sums -= np.column_stack([
+            np.bincount(labels, weights=self.points[rows, 0][assigned], minlength=n_slots),
+            np.bincount(labels, weights=self.points[rows, 1][assigned], minlength=n_slots)
+        ])
+        self.counts -= np.bincount(labels, minlength=n_slots)
+        self.labels[rows] = -1
+
+    def new_slots(self, centroids):
+        n_new = len(centroids)
+        self.sums = np.vstack([self.sums, centroids])
+        self.counts = np.concatenate([self.counts, np.ones(n_new, dtype=np.int64)])
+        self.alive = np.concatenate([self.alive, np.ones(n_new, dtype=bool)])
+        return list(range(len(self.counts) - n_new, len(self.counts)))
+
+    def reassign(self, rows):
+        """One Lloyd pass over the window, rebuilding the statistics from scratch"""
+        labels, _ = self.nearest(rows)
+        self.sums[:] = 0
+        self.counts[:] = 0
+        self.add(rows, labels)
+
+
+def _neighbourhood_counts(cells):
+    """Occupied grid cells and the number of points in each one's 3 × 3 neighbourhood"""
+    keys, counts = np.unique(cells, axis=0, return_counts=True)
+    span = int(np.ptp(keys[:, 1])) + 3
+    linear = (keys[:, 0] - keys[:, 0].min() + 1) * span + (keys[:, 1] - keys[:, 1].min() + 1)
+
+    totals = np.zeros(len(keys), dtype=np.int64)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = linear + dx * span + dy
+            pos = np.clip(np.searchsorted(linear, target), 0, len(linear) - 1)
+            found = linear[pos] == target
+            totals[found] += counts[pos[found]]
+    return keys, totals
+
+
+def track_hotspot_drift(df, n_clusters, window_days=90, step_days=7, n_refine=1,
+                        min_cluster_share=0.01, birth_share=0.05, birth_cell_km=1.0,
+                        random_state=42):
+    """
+    Sliding-window spatial re-clustering over the full history.
+
+    The first window is fitted with K-Means; every later window is updated
+    incrementally: points leaving the window are subtracted from their
+    cluster's running sums, new points are assigned to the nearest centroid and
+    added, then `n_refine` Lloyd passes warm-started from those centroids
+    settle the window. Data is sorted by date once, so every window is a
+    contiguous slice.
+
+    Hotspot lifecycle:
+    - death: a cluster whose membership falls below min_cluster_share of the window
+    - birth: a 3 × 3 block of `birth_cell_km` grid cells lying beyond twice the
+      RMS radius of the nearest cluster and holding at least birth_share × the
+      median cluster size seeds a new cluster
+
+    Returns centroid tracks per window and birth/death events.
+    """
+    print(f"Tracking hotspot drift: {window_days}-day windows every {step_days} days...")
+
+    dates = pd.to_datetime(df["Date"]).values.astype("datetime64[ns]")
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    points = _to_km(df["Latitude"].values[order], df["Longitude"].values[order])
+
+    window = np.timedelta64(window_days, "D")
+    step = np.timedelta64(step_days, "D")
+    ends = np.arange(dates[0] + window, dates[-1] + step, step)
+    his = np.searchsorted(dates, ends, side="left")
+    los = np.searchsorted(dates, ends - window, side="left")
+
+    state = _WindowState(points)
+    tracks, events = [], []
+    prev_lo = prev_hi = 0
+
+    for end, lo, hi in zip(ends, los, his):
+        window_end = str(pd.Timestamp(end - np.timedelta64(1, "D")).date())
+        rows = slice(lo, hi)
+        threshold = max(1, int(min_cluster_share * (hi - lo)))
+
+        if hi - lo < n_clusters:
+            continue
+
+        if state.alive.any():
+            state.remove(slice(prev_lo, min(lo, prev_hi)))
+            if not state.counts[state.alive].any():
+                # Every hotspot emptied out (a gap in the data): start again from scratch
+                for slot in np.flatnonzero(state.alive):
+                    events.append({"event": "death", "track_id": int(slot), "window_end": window_end})
+                state.alive[:] = False
+
+        if not state.alive.any():
+            # (Re)initialise from scratch: first window, or after every hotspot died
+            model = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10).fit(points[rows])
+            state.remove(slice(prev_lo, prev_hi))
+            slots = state.new_slots(model.cluster_centers_)
+            state.sums[slots] = 0
+            state.counts[slots] = 0
+            state.add(rows, np.asarray(slots)[model.labels_])
+            for slot in slots:
+                events.append({"event": "birth", "track_id": slot, "window_end": window_end})
+        else:
+            # Incremental slide: leaving points are already dropped; assign and add entering points
+            entering = slice(max(prev_hi, lo), hi)
+            if entering.stop > entering.start:
+                labels, _ = state.nearest(entering)
+                state.add(entering, labels)
+
+            # Deaths: clusters that have faded below the threshold
+            dying = np.flatnonzero(state.alive & (state.counts < threshold))
+            if len(dying) and len(dying) < state.alive.sum():
+                state.alive[dying] = False
+                for slot in dying:
+                    events.append({"event": "death", "track_id": int(slot), "window_end": window_end})
+                state.reassign(rows)
+
+            # Births: a dense cell well outside every live cluster (beyond
+            # 2 × its RMS radius) holding a sizeable share of a typical cluster
+            labels, sq_dist = state.nearest(rows)
+            n_slots = len(state.counts)
+            radius_sq = np.bincount(labels, weights=sq_dist, minlength=n_slots) / np.maximum(
+                np.bincount(labels, minlength=n_slots), 1)
+            uncovered = np.flatnonzero(sq_dist > 4 * radius_sq[labels])
+            birth_threshold = max(threshold, int(birth_share * np.median(state.counts[state.alive])))
+            if len(uncovered) >= birth_threshold:
+                cells = np.floor(points[lo + uncovered] / birth_cell_km).astype(np.int64)
+                keys, cell_counts = _neighbourhood_counts(cells)
+                densest = np.argmax(cell_counts)
+                if cell_counts[densest] >= birth_threshold:
+                    near = np.all(np.abs(cells - keys[densest]) <= 1, axis=1)
+                    members = points[lo + uncovered[near]]
+                    slot = state.new_slots(members.mean(axis=0, keepdims=True))[0]
+                    events.append({"event": "birth", "track_id": slot, "window_end": window_end})
+                    state.reassign(rows)
+
+            for _ in range(n_refine):
+                state.reassign(rows)
+
+            # Clusters left with no points after the passes above have died too
+            emptied = np.flatnonzero(state.alive & (state.counts == 0))
+            state.alive[emptied] = False
+            for slot in emptied:
+                events.append({"event": "death", "track_id": int(slot), "window_end": window_end})
+
+        prev_lo, prev_hi = lo, hi
+
+        lat, lon = _to_latlon(state.centroids)
+        for slot in np.flatnonzero(state.alive):
+            tracks.append({
+                "window_end": window_end,
+                "track_id": int(slot),
+                "latitude": float(lat[slot]),
+                "longitude": float(lon[slot]),
+                "crimes": int(state.counts[slot])
+            })
+
+    for event in events:
+        last = [t for t in tracks if t["track_id"] == event["track_id"]]
+        if event["event"] == "birth" and last:
+            event.update(latitude=last[0]["latitude"], longitude=last[0]["longitude"])
+        elif event["event"] == "death" and last:
+            event.update(latitude=last[-1]["latitude"], longitude=last[-1]["longitude"])
+
+    results = {
+        "window_days": window_days,
+        "step_days": step_days,
+        "n_windows": len({t["window_end"] for t in tracks}),
+        "tracks": tracks,
+        "events": events,
+        "summary": _summarize_tracks(tracks, events)
+    }
+
+    print(f"✓ Drift tracked over {results['n_windows']} windows: "
+          f"{results['summary']['births']} births, {results['summary']['deaths']} deaths")
+    return results
+
+
+def _summarize_tracks(tracks, events):
+    """Net displacement and path length (km) per track"""
+    frame = pd.DataFrame(tracks)
+    per_track = []
+    if len(frame):
+        for track_id, track in frame.groupby("track_id", sort=True):
+            xy = _to_km(track["latitude"].values, track["longitude"].values)
+            steps = np.linalg.norm(np.diff(xy, axis=0), axis=1)
+            per_track.append({
+                "track_id": int(track_id),
+                "first_window": track["window_end"].iloc[0],
+                "last_window": track["window_end"].iloc[-1],
+                "windows": int(len(track)),
+                "net_drift_km": float(np.linalg.norm(xy[-1] - xy[0])),
+                "path_length_km": float(steps.sum())
+            })
+
+    return {
+        "births": sum(e["event"] == "birth" for e in events),
+        "deaths": sum(e["event"] == "death" for e in events),
+        "tracks": per_track
+    }
+
+
+def save_drift_results(results, output_path="outputs/"):
+    """Save hotspot drift tracks and events"""
+    os.makedirs(output_path, exist_ok=True)
+
+    output_file = os.path.join(output_path, "hotspot_drift.json")
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=4)
+
+    print(f"✓ Hotspot drift saved to {output_file}")
+    return output_file
@@ -0,0 +1,177 @@
+# src/filter_index.py
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import PROCESSED_DATE_FORMAT
+from src.preprocessing import RAW_DATE_FORMAT
+
+# Categorical columns that get one bitmap per distinct value
+FILTER_COLUMNS = ["Primary Type", "District", "Arrest"]
+
+
+def data_fingerprint(df, n_samples=10000):
+    """
+    Cheap fingerprint of the rows an index is built over: row count, sum of
+    incident IDs and a hash of the rows at up to `n_samples` evenly spaced
+    positions. Re-ingested data with the same row count, or reordered rows,
+    gets a different fingerprint.
+    """
+    positions = np.unique(np.linspace(0, len(df) - 1, min(n_samples, len(df))).astype(np.int64))
+    key = df[["ID"]] if "ID" in df.columns else df[[c for c in FILTER_COLUMNS if c in df.columns]]
+
+    digest = hashlib.sha1(str(len(df)).encode())
+    if "ID" in df.columns:
+        digest.update(str(pd.to_numeric(df["ID"], errors="coerce").sum()).encode())
+    digest.update(pd.util.hash_pandas_object(key.iloc[positions], index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def build_filter_index(df, columns=FILTER_COLUMNS):
+    """
+    Precompute filter indexes over the rows of `df` (in row order):
+
+    - bitmaps: per categorical column, a packed bitmap (n_values, ceil(n / 8))
+      with bit i set when row i has that value
+    - date positions: row positions sorted by Date, so a date range is a
+      contiguous slice found with two binary searches
+
+    Combined filters then become bitwise OR (within a column) and AND
+    (across columns) over packed bitmaps instead of scans over every row.
+    """
+    print(f"Building filter index over {len(df):,} rows...")
+
+    n_rows = len(df)
+    index = {"n_rows": n_rows, "fingerprint": data_fingerprint(df), "values": {}, "bitmaps": {}}
+
+    for column in columns:
+        # Missing values get code -1 and are left unindexed
+        codes, values = pd.factorize(df[column], sort=True)
+        index["values"][column] = [str(v) for v in values]
+
+        # One stable sort groups the rows of each value; bitmaps are filled from the groups
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+
+        bitmaps = np.zeros((len(values), (n_rows + 7) // 8), dtype=np.uint8)
+        bits = np.zeros(n_rows, dtype=bool)
+        for v in range(len(values)):
+            positions = order[bounds[v]:bounds[v + 1]]
+            bits[positions] = True
+            bitmaps[v] = np.packbits(bits)
+            bits[positions] = False
+        index["bitmaps"][column] = bitmaps
+
+    dates = df["Date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Processed-store format first, then the raw export format; never inferred
+        raw_dates = dates
+        dates = pd.to_datetime(raw_dates, format=PROCESSED_DATE_FORMAT, errors="coerce")
+        fallback = dates.isna()
+        if fallback.any():
+            dates[fallback] = pd.to_datetime(raw_dates[fallback], format=RAW_DATE_FORMAT, errors="coerce")
+    date_values = dates.values.astype("datetime64[ns]").astype(np.int64)
+
+    index["date_order"] = np.argsort(date_values, kind="stable").astype(np.int64)
+    index["sorted_dates"] = date_values[index["date_order"]]
+
+    print(f"✓ Filter index built: {sum(len(v) for v in index['values'].values())} bitmaps")
+    return index
+
+
+def date_bounds(index):
+    """Earliest and latest indexed date (NaT rows are ignored)"""
+    valid = index["sorted_dates"][index["sorted_dates"] != np.iinfo(np.int64).min]
+    if len(valid) == 0:
+        return None, None
+    return pd.Timestamp(valid[0]), pd.Timestamp(valid[-1])
+
+
+def _date_bitmap(index, start=None, end=None):
+    """Packed bitmap of rows with start <= Date < end (NaT rows never match)"""
+    sorted_dates = index["sorted_dates"]
+    # NaT is stored as the smallest int64, so it sorts before every real date
+    first_valid = np.searchsorted(sorted_dates, np.iinfo(np.int64).min, side="right")
+    lo = first_valid if start is None else max(
+        first_valid, np.searchsorted(sorted_dates, pd.Timestamp(start).value, side="left"))
+    hi = len(sorted_dates) if end is None else np.searchsorted(sorted_dates, pd.Timestamp(end).value, side="left")
+
+    bits = np.zeros(index["n_rows"], dtype=bool)
+    bits[index["date_order"][lo:hi]] = True
+    return np.packbits(bits)
+
+
+def query_filter_index(index, filters=None, start=None, end=None):
+    """
+    Row positions matching every filter.
+
+    filters:    {column: [values]} — rows match any listed value of a column
+                (values compared as strings); empty/None lists are ignored
+    start, end: optional date range [start, end)
+    """
+    mask = None
+
+    for column, selected in (filters or {}).items():
+        if not selected:
+            continue
+        lookup = {value: i for i, value in enumerate(index["values"][column])}
+        rows = [lookup[str(value)] for value in selected if str(value) in lookup]
+
+        bitmap = (
+            np.bitwise_or.reduce(index["bitmaps"][column][rows], axis=0)
+            if rows else np.zeros((index["n_rows"] + 7) // 8, dtype=np.uint8)
+        )
+        mask = bitmap if mask is None else mask & bitmap
+
+    if start is not None or end is not None:
+        bitmap = _date_bitmap(index, start, end)
+        mask = bitmap if mask is None else mask & bitmap
+
+    if mask is None:
+        return np.arange(index["n_rows"])
+    return np.flatnonzero(np.unpackbits(mask, count=index["n_rows"]))
+
+
+def save_filter_index(index, output_path="data/processed/"):
+    """Save the filter index as a compressed .npz plus JSON metadata"""
+    os.makedirs(output_path, exist_ok=True)
+
+    arrays = {
+        "date_order": index["date_order"],
+        "sorted_dates": index["sorted_dates"]
+    }
+    for i, column in enumerate(index["bitmaps"]):
+        arrays[f"bitmaps_{i}"] = index["bitmaps"][column]
+
+    index_file = os.path.join(output_path, "filter_index.npz")
+    np.savez_compressed(index_file, **arrays)
+
+    with open(os.path.join(output_path, "filter_index.json"), 'w') as f:
+        json.dump({
+            "n_rows": index["n_rows"],
+            "fingerprint": index["fingerprint"],
+            "columns": list(index["bitmaps"]),
+            "values": index["values"]
+        }, f, indent=4)
+
+    print(f"✓ Filter index saved to {index_file}")
+    return index_file
+
+
+def load_filter_index(output_path="data/processed/"):
+    """Load a filter index saved by save_filter_index"""
+    with open(os.path.join(output_path, "filter_index.json")) as f:
+        meta = json.load(f)
+
+    arrays = np.load(os.path.join(output_path, "filter_index.npz"))
+    return {
+        "n_rows": meta["n_rows"],
+        "fingerprint": meta.get("fingerprint"),
+        "values": meta["values"],
+        "bitmaps": {column: arrays[f"bitmaps_{i}"] for i, column in enumerate(meta["columns"])},
+        "date_order": arrays["date_order"],
+        "sorted_dates": arrays["sorted_dates"]
+    }
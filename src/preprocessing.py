@@ -1,5 +1,8 @@
 import pandas as pd
 
+# Date format of the Chicago crimes export, e.g. "01/05/2023 10:00:00 PM"
+RAW_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
 def clean_data(df):
     """
     Robust cleaning for large, messy Chicago crime data
@@ -12,11 +15,17 @@ def clean_data(df):
     df["Date"] = df["Date"].astype(str)
 
     # 3️⃣ Parse datetime safely (mixed formats)
+    #    Export format first, then element-wise fallback for anything else,
+    #    so each row parses the same no matter which rows surround it
+    raw_dates = df["Date"]
     df["Date"] = pd.to_datetime(
-        df["Date"],
-        errors="coerce",
-        infer_datetime_format=True
+        raw_dates,
+        format=RAW_DATE_FORMAT,
+        errors="coerce"
     )
+    fallback = df["Date"].isna()
+    if fallback.any():
+        df.loc[fallback, "Date"] = pd.to_datetime(raw_dates[fallback], errors="coerce")
 
     # 4️⃣ Drop rows where datetime parsing failed
     df = df.dropna(subset=["Date"]).copy()
@@ -0,0 +1,115 @@
+# src/stability.py
+import json
+import os
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial.distance import cdist
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score
+
+
+def _bootstrap_centroids(X, k, seed, n_init):
+    """
+    Fit K-Means on one bootstrap resample.
+
+    The resample is expressed as per-row multiplicities (sample_weight), which
+    is equivalent to fitting on the duplicated rows but never copies X. Only
+    the seed goes to the worker; X itself is memory-mapped by joblib.
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.bincount(rng.integers(0, len(X), len(X)), minlength=len(X))
+
+    model = KMeans(n_clusters=k, random_state=seed, n_init=n_init)
+    model.fit(X, sample_weight=weights)
+    return model.cluster_centers_
+
+
+def align_centroids(reference, centroids):
+    """Reorder `centroids` to match `reference` (Hungarian matching on distance)"""
+    _, order = linear_sum_assignment(cdist(reference, centroids))
+    return centroids[order]
+
+
+def _nearest_centroid(X, centroids):
+    return np.argmin(cdist(X, centroids, "sqeuclidean"), axis=1)
+
+
+def bootstrap_stability(X, k, n_boot=100, n_jobs=-1, random_state=42, n_init=10):
+    """
+    Bootstrap stability of K-Means with `k` clusters.
+
+    Every replicate is refit in parallel, its centroids are aligned to the
+    reference fit, and all points are relabelled with the aligned centroids.
+    Returns the adjusted-Rand distribution against the reference labels and
+    per-cluster Jaccard stability (> 0.75 is usually read as stable).
+    """
+    print(f"Running bootstrap stability for K={k} ({n_boot} replicates)...")
+
+    X = np.ascontiguousarray(X)
+    reference = KMeans(n_clusters=k, random_state=random_state, n_init=n_init).fit(X)
+    ref_centroids = reference.cluster_centers_
+    ref_labels = reference.labels_
+
+    seeds = np.random.SeedSequence(random_state).generate_state(n_boot)
+    replicates = Parallel(n_jobs=n_jobs)(
+        delayed(_bootstrap_centroids)(X, k, int(seed), n_init) for seed in seeds
+    )
+
+    ari = np.empty(n_boot)
+    jaccard = np.empty((n_boot, k))
+    shift = np.empty((n_boot, k))
+    ref_sizes = np.bincount(ref_labels, minlength=k)
+
+    for b, centroids in enumerate(replicates):
+        aligned = align_centroids(ref_centroids, centroids)
+        labels = _nearest_centroid(X, aligned)
+
+        ari[b] = adjusted_rand_score(ref_labels, labels)
+
+        confusion = np.bincount(ref_labels * k + labels, minlength=k * k).reshape(k, k)
+        overlap = np.diag(confusion)
+        union = ref_sizes + confusion.sum(axis=0) - overlap
+        jaccard[b] = overlap / np.maximum(union, 1)
+        shift[b] = np.linalg.norm(aligned - ref_centroids, axis=1)
+
+    clusters = [
+        {
+            "cluster": c,
+            "size": int(ref_sizes[c]),
+            "jaccard_mean": float(jaccard[:, c].mean()),
+            "jaccard_std": float(jaccard[:, c].std()),
+            "stable_fraction": float(np.mean(jaccard[:, c] > 0.75)),
+            "centroid_shift_mean": float(shift[:, c].mean())
+        }
+        for c in range(k)
+    ]
+
+    results = {
+        "k": int(k),
+        "n_bootstrap": int(n_boot),
+        "ari_mean": float(ari.mean()),
+        "ari_std": float(ari.std()),
+        "ari_percentiles": {
+            str(p): float(v) for p, v in zip((5, 25, 50, 75, 95), np.percentile(ari, [5, 25, 50, 75, 95]))
+        },
+        "ari_values": [float(v) for v in ari],
+        "clusters": clusters
+    }
+
+    print(f"✓ Stability: ARI {results['ari_mean']:.3f} ± {results['ari_std']:.3f}, "
+          f"least stable cluster Jaccard {min(c['jaccard_mean'] for c in clusters):.3f}")
+    return results
+
+
+def save_stability_results(results, output_path="outputs/"):
+    """Save bootstrap stability results"""
+    os.makedirs(output_path, exist_ok=True)
+
+    output_file = os.path.join(output_path, "stability_results.json")
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=4)
+
+    print(f"✓ Stability results saved to {output_file}")
+    return output_file
@@ -0,0 +1,276 @@
+# src/tensor.py
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Fixed grid over the Chicago bounding box (lat_min, lat_max, lon_min, lon_max).
+# Keeping the grid fixed means cell ids stay stable across incremental updates.
+CHICAGO_BOUNDS = (41.64, 42.03, -87.94, -87.52)
+CELL_SIZE = 0.01
+
+# 2001-01-01 is a Monday, so (days since origin) % 7 is the day of week.
+WEEK_ORIGIN = "2001-01-01"
+HOURS_PER_WEEK = 168
+
+
+def grid_shape(bounds=CHICAGO_BOUNDS, cell_size=CELL_SIZE):
+    """Number of (lat, lon) grid rows and columns covering the bounds"""
+    lat_min, lat_max, lon_min, lon_max = bounds
+    n_lat = int(np.ceil(round((lat_max - lat_min) / cell_size, 6)))
+    n_lon = int(np.ceil(round((lon_max - lon_min) / cell_size, 6)))
+    return n_lat, n_lon
+
+
+def assign_grid_cells(lat, lon, bounds=CHICAGO_BOUNDS, cell_size=CELL_SIZE):
+    """Map coordinates to flat grid cell ids (-1 outside the bounds)"""
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    lat_min, lat_max, lon_min, lon_max = bounds
+    n_lat, n_lon = grid_shape(bounds, cell_size)
+
+    inside = (lat >= lat_min) & (lat < lat_max) & (lon >= lon_min) & (lon < lon_max)
+    row = np.clip(((lat - lat_min) / cell_size).astype(np.int64), 0, n_lat - 1)
+    col = np.clip(((lon - lon_min) / cell_size).astype(np.int64), 0, n_lon - 1)
+
+    return np.where(inside, row * n_lon + col, -1)
+
+
+def cell_centers(tensor):
+    """(n_cells, 2) array of [lat, lon] cell centres"""
+    lat_min, _, lon_min, _ = tensor["bounds"]
+    n_lat, n_lon = tensor["grid_shape"]
+    cell_size = tensor["cell_size"]
+
+    rows, cols = np.divmod(np.arange(n_lat * n_lon), n_lon)
+    return np.column_stack([
+        lat_min + (rows + 0.5) * cell_size,
+        lon_min + (cols + 0.5) * cell_size
+    ])
+
+
+def _time_bins(dates):
+    """Week index and hour-of-week for each timestamp (relative to WEEK_ORIGIN)"""
+    dates = pd.to_datetime(pd.Series(dates)).values
+    hours = (dates - np.datetime64(WEEK_ORIGIN)).astype("timedelta64[h]").astype(np.int64)
+    return hours // HOURS_PER_WEEK, hours % HOURS_PER_WEEK
+
+
+def _count_block(df, crime_types, bounds, cell_size):
+    """
+    Vectorized COO triplets for a batch of incidents.
+    Unseen crime types are appended to `crime_types` in place.
+    """
+    n_cells = int(np.prod(grid_shape(bounds, cell_size)))
+
+    cells = assign_grid_cells(df["Latitude"].values, df["Longitude"].values, bounds, cell_size)
+    weeks, hour_of_week = _time_bins(df["Date"])
+
+    types = df["Primary Type"].astype(str).values
+    vocab = pd.Index(crime_types)
+    unseen = pd.unique(types[vocab.get_indexer(types) == -1])
+    crime_types.extend(sorted(unseen))
+    type_codes = pd.Index(crime_types).get_indexer(types)
+
+    keep = (cells >= 0) & (weeks >= 0)
+    rows = weeks[keep] * HOURS_PER_WEEK + hour_of_week[keep]
+    cols = type_codes[keep] * n_cells + cells[keep]
+
+    return rows, cols
+
+
+def build_count_tensor(df, bounds=CHICAGO_BOUNDS, cell_size=CELL_SIZE):
+    """
+    Build a sparse cell × hour-of-week × week × crime-type count tensor.
+
+    The tensor is stored as a CSR matrix with one row per (week, hour-of-week)
+    bin and one column per (crime type, cell) pair:
+
+        row = week * 168 + hour_of_week
+        col = type_index * n_cells + cell
+
+    New weeks append rows and new crime types append columns, so incremental
+    updates never renumber existing entries.
+    """
+    print("Building spatio-temporal count tensor...")
+
+    tensor = {
+        "counts": sparse.csr_matrix((0, 0), dtype=np.int32),
+        "crime_types": [],
+        "bounds": tuple(bounds),
+        "cell_size": cell_size,
+        "grid_shape": grid_shape(bounds, cell_size),
+        "week_origin": WEEK_ORIGIN,
+        "latest_date": None,
+        "n_incidents": 0
+    }
+    tensor = update_count_tensor(tensor, df)
+
+    print(f"✓ Count tensor built: {n_weeks(tensor)} weeks × {HOURS_PER_WEEK} hours × "
+          f"{n_cells(tensor)} cells × {len(tensor['crime_types'])} crime types "
+          f"({tensor['counts'].nnz:,} non-zero bins)")
+    return tensor
+
+
+def update_count_tensor(tensor, df):
+    """Add a batch of new incidents to an existing count tensor"""
+    dates = pd.to_datetime(df["Date"])
+    if len(dates):
+        latest = dates.max() if tensor["latest_date"] is None else max(dates.max(), pd.Timestamp(tensor["latest_date"]))
+        tensor["latest_date"] = str(latest)
+    tensor["n_incidents"] += len(df)
+
+    rows, cols = _count_block(df, tensor["crime_types"], tensor["bounds"], tensor["cell_size"])
+
+    n_rows = n_weeks(tensor) * HOURS_PER_WEEK
+    if len(rows):
+        n_rows = max(n_rows, int(rows.max() // HOURS_PER_WEEK + 1) * HOURS_PER_WEEK)
+    shape = (n_rows, len(tensor["crime_types"]) * n_cells(tensor))
+
+    batch = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=shape
+    )
+
+    counts = tensor["counts"]
+    counts.resize(shape)
+    tensor["counts"] = (counts + batch).tocsr()
+    return tensor
+
+
+def refresh_count_tensor(df, output_path="data/processed/"):
+    """
+    Count tensor for `df`, reusing the tensor saved in `output_path` when `df`
+    only extends the history it was built from.
+
+    The saved tensor is reused when `df` has exactly as many incidents up to
+    the tensor's latest date as were counted into it; only the later incidents
+    are then added with update_count_tensor. Anything else (no saved tensor,
+    re-ingested or corrected history) rebuilds from scratch.
+    """
+    try:
+        tensor = load_count_tensor(output_path)
+    except (OSError, ValueError, KeyError):
+        return build_count_tensor(df)
+
+    dates = pd.to_datetime(df["Date"])
+    latest = tensor.get("latest_date")
+    if (latest is None or tuple(tensor["bounds"]) != CHICAGO_BOUNDS
+            or tensor["cell_size"] != CELL_SIZE
+            or (dates <= pd.Timestamp(latest)).sum() != tensor.get("n_incidents")):
+        return build_count_tensor(df)
+
+    new_rows = df[dates > pd.Timestamp(latest)]
+    print(f"Updating saved count tensor with {len(new_rows):,} incidents after {latest}...")
+    return update_count_tensor(tensor, new_rows)
+
+
+def n_weeks(tensor):
+    return tensor["counts"].shape[0] // HOURS_PER_WEEK
+
+
+def n_cells(tensor):
+    n_lat, n_lon = tensor["grid_shape"]
+    return n_lat * n_lon
+
+
+def _type_collapse(tensor, crime_types=None):
+    """Sparse (n_types * n_cells, n_cells) matrix summing over the selected crime types"""
+    cells = n_cells(tensor)
+    selected = tensor["crime_types"] if crime_types is None else list(crime_types)
+    codes = pd.Index(tensor["crime_types"]).get_indexer(selected)
+    codes = codes[codes >= 0]
+
+    rows = (codes[:, None] * cells + np.arange(cells)).ravel()
+    cols = np.tile(np.arange(cells), len(codes))
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(tensor["counts"].shape[1], cells)
+    )
+
+
+def _row_groups(n_rows, group_of_row, n_groups):
+    """Sparse (n_groups, n_rows) indicator matrix for summing rows by group"""
+    return sparse.csr_matrix(
+        (np.ones(n_rows, dtype=np.int32), (group_of_row, np.arange(n_rows))),
+        shape=(n_groups, n_rows)
+    )
+
+
+def _week_range(tensor, weeks):
+    """Start and stop week of a contiguous `slice` of weeks"""
+    weeks = slice(0, n_weeks(tensor)) if weeks is None else weeks
+    start, stop, step = weeks.indices(n_weeks(tensor))
+    if step != 1:
+        raise ValueError(f"Week slices must be contiguous (step 1), got step {step}")
+    return start, max(start, stop)
+
+
+def weekly_cell_counts(tensor, crime_types=None, weeks=None):
+    """
+    Sparse (n_weeks, n_cells) incident counts, optionally restricted to
+    a subset of crime types and a contiguous `slice` of weeks
+    """
+    start, stop = _week_range(tensor, weeks)
+    counts = tensor["counts"][start * HOURS_PER_WEEK:stop * HOURS_PER_WEEK]
+
+    n_rows = counts.shape[0]
+    group = _row_groups(n_rows, np.arange(n_rows) // HOURS_PER_WEEK, n_rows // HOURS_PER_WEEK)
+    return (group @ counts @ _type_collapse(tensor, crime_types)).tocsr()
+
+
+def hourly_cell_counts(tensor, crime_types=None, weeks=None):
+    """Dense (24, n_cells) hour-of-day counts, optionally for a contiguous `slice` of weeks"""
+    start, stop = _week_range(tensor, weeks)
+    counts = tensor["counts"][start * HOURS_PER_WEEK:stop * HOURS_PER_WEEK]
+
+    n_rows = counts.shape[0]
+    group = _row_groups(n_rows, np.arange(n_rows) % 24, 24)
+    return (group @ counts @ _type_collapse(tensor, crime_types)).toarray()
+
+
+def cell_trend(tensor, cells, crime_types=None):
+    """Weekly incident counts summed over one or more cells"""
+    weekly = weekly_cell_counts(tensor, crime_types)
+    return np.asarray(weekly[:, np.atleast_1d(cells)].sum(axis=1)).ravel()
+
+
+def rolling_window_counts(tensor, window=4, crime_types=None):
+    """Dense (n_weeks, n_cells) trailing `window`-week incident counts per cell"""
+    if window < 1:
+        raise ValueError(f"window must be at least 1 week, got {window}")
+    weekly = weekly_cell_counts(tensor, crime_types).toarray()
+    cumulative = np.cumsum(weekly, axis=0)
+    rolling = cumulative.copy()
+    rolling[window:] -= cumulative[:-window]
+    return rolling
+
+
+def save_count_tensor(tensor, output_path="data/processed/"):
+    """Save the count tensor as a compressed sparse matrix plus JSON metadata"""
+    os.makedirs(output_path, exist_ok=True)
+
+    matrix_file = os.path.join(output_path, "crime_tensor.npz")
+    meta_file = os.path.join(output_path, "crime_tensor.json")
+
+    sparse.save_npz(matrix_file, tensor["counts"], compressed=True)
+
+    meta = {key: value for key, value in tensor.items() if key != "counts"}
+    with open(meta_file, 'w') as f:
+        json.dump(meta, f, indent=4)
+
+    print(f"✓ Count tensor saved to {matrix_file}")
+    return matrix_file
+
+
+def load_count_tensor(output_path="data/processed/"):
+    """Load a count tensor saved by save_count_tensor"""
+    with open(os.path.join(output_path, "crime_tensor.json")) as f:
+        tensor = json.load(f)
+
+    tensor["bounds"] = tuple(tensor["bounds"])
+    tensor["grid_shape"] = tuple(tensor["grid_shape"])
+    tensor["counts"] = sparse.load_npz(os.path.join(output_path, "crime_tensor.npz")).tocsr()
+    return tensor
@@ -1,223 +1,378 @@
 # src/train.py
 import os
-import sys
 import mlflow
 import mlflow.sklearn
 import json
 import logging
-from datetime import datetime
 
-import pandas as pd
 import numpy as np
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import silhouette_score, davies_bouldin_score
 
-from src.data_loader import load_data
+from src.data_loader import (
+    RAW_DATA_PATH, PROCESSED_DATA_PATH,
+    load_data, save_processed, load_processed, parallel_ingest
+)
 from src.preprocessing import clean_data
 from src.features import select_features
-from src.clustering import kmeans_cluster, dbscan_cluster
+from src.clustering import kmeans_cluster, kmeans_fit, dbscan_sweep
 from src.dimensionality import apply_pca, get_feature_importance, save_dimensionality_results
+from src.tensor import refresh_count_tensor, save_count_tensor, hourly_cell_counts, cell_centers
+from src.patrol import plan_shifts
+from src.stability import bootstrap_stability, save_stability_results
+from src.profiles import assign_clusters, profile_clusters, save_cluster_profiles
+from src.filter_index import build_filter_index, save_filter_index
+from src.drift import track_hotspot_drift, save_drift_results
 
-# ==================== LOGGING SETUP ====================
-os.makedirs("logs", exist_ok=True)
-log_filename = f"logs/training_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# ==================== MLflow SETUP ====================
-os.environ["GIT_PYTHON_REFRESH"] = "quiet"
-mlflow.set_experiment("Chicago Crime Clustering")
+# Bootstrap replicates for the cluster stability analysis
+N_BOOTSTRAP = 100
+
+# DBSCAN grid (on standardized features); the neighbour graph is built once for max eps
+DBSCAN_EPS_VALUES = [0.1, 0.2, 0.3, 0.4]
+DBSCAN_MIN_SAMPLES_VALUES = [10, 25, 50]
 
-logger.info("="*80)
-logger.info("STARTING CHICAGO CRIME CLUSTERING PIPELINE")
-logger.info("="*80)
+# Sliding-window hotspot drift: the last 90 days, stepped weekly
+DRIFT_WINDOW_DAYS = 90
+DRIFT_STEP_DAYS = 7
 
-try:
-    # -------- STEP 1: Load Data --------
-    logger.info("STEP 1: Loading Chicago crime data...")
-    df = load_data("data/raw/chicago_crime.csv")
-    logger.info(f"✓ Original dataset shape: {df.shape}")
-    
-    # -------- STEP 2: Clean Data --------
-    logger.info("STEP 2: Cleaning and preprocessing data...")
-    df = clean_data(df)
-    logger.info(f"✓ After cleaning shape: {df.shape}")
-    
-    # ✨ SAVE PROCESSED DATA ✨
-    os.makedirs("data/processed", exist_ok=True)
-    df.to_csv("data/processed/crime_cleaned.csv", index=False)
-    logger.info("✓ Cleaned data saved to data/processed/crime_cleaned.csv")
-    
-    # -------- STEP 3: Sample Data --------
-    logger.info("STEP 3: Sampling 50,000 records for processing...")
-    if len(df) > 50000:
-        df = df.sample(n=50000, random_state=42)
-    logger.info(f"✓ Sampled dataset shape: {df.shape}")
-    
-    # -------- STEP 4: Feature Selection --------
-    logger.info("STEP 4: Selecting features for clustering...")
-    X = select_features(df)
-    logger.info(f"✓ Features selected: {X.columns.tolist()}")
-    logger.info(f"✓ Feature matrix shape: {X.shape}")
-    
-    # -------- STEP 5: Feature Scaling --------
-    logger.info("STEP 5: Scaling features...")
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    logger.info("✓ Features scaled successfully")
-    
-    # -------- STEP 6: Dimensionality Reduction (PCA) --------
-    logger.info("STEP 6: Applying PCA for feature reduction...")
-    X_pca, explained_var, pca_model = apply_pca(X_scaled, n_components=3)
-    
-    feature_importance = get_feature_importance(pca_model, X.columns.tolist())
-    logger.info(f"✓ PCA completed. Explained variance: {np.cumsum(explained_var)[-1]:.4f}")
-    logger.info(f"✓ Top 5 Important Features: {list(feature_importance.items())[:5]}")
-    
-    # Save PCA results
-    save_dimensionality_results(X_pca, explained_var, feature_importance)
-    
-    # -------- STEP 7: K-Means Clustering --------
-    logger.info("STEP 7: Training K-Means clustering models...")
-    
-    kmeans_results = []
-    best_kmeans_k = None
-    best_kmeans_score = -1
-    
-    for k in range(3, 11):
-        logger.info(f"  Testing K-Means with K={k}...")
+EXPERIMENT_NAME = "Chicago Crime Clustering"
+REGISTERED_MODEL_NAME = "chicago-crime-kmeans"
+
+
+def run_pipeline(raw_path=RAW_DATA_PATH, ingest_workers=1, from_processed=False):
+    """
+    Run the full clustering pipeline.
+
+    raw_path:        raw Chicago crimes CSV to load + clean
+    ingest_workers:  > 1 loads + cleans the raw CSV with multiple processes
+    from_processed:  skip ingest and start from the processed store
+                     (PROCESSED_DATA_PATH, written by `cli ingest`)
+    """
+    # ==================== MLflow SETUP ====================
+    os.environ["GIT_PYTHON_REFRESH"] = "quiet"
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    
+    logger.info("="*80)
+    logger.info("STARTING CHICAGO CRIME CLUSTERING PIPELINE")
+    logger.info("="*80)
+    
+    try:
+        if from_processed:
+            # -------- STEP 1-2: Load Processed Data --------
+            logger.info(f"STEP 1-2: Loading cleaned data from {PROCESSED_DATA_PATH}...")
+            df = load_processed(PROCESSED_DATA_PATH)
+            logger.info(f"✓ Cleaned dataset shape: {df.shape}")
+        elif ingest_workers > 1:
+            # -------- STEP 1-2: Parallel Load + Clean --------
+            logger.info(f"STEP 1-2: Loading and cleaning data with {ingest_workers} worker processes...")
+            ingest_stats = parallel_ingest(raw_path, PROCESSED_DATA_PATH, n_workers=ingest_workers)
+            logger.info(f"✓ Original rows: {ingest_stats['raw_rows']:,}, "
+                        f"throughput: {ingest_stats['rows_per_sec']:,.0f} rows/s")
+            logger.info(f"✓ Cleaned data saved to {PROCESSED_DATA_PATH}")
         
-        with mlflow.start_run(nested=True):
-            labels, score = kmeans_cluster(X_scaled, k=k)
+            df = load_processed(PROCESSED_DATA_PATH)
+            logger.info(f"✓ After cleaning shape: {df.shape}")
+        else:
+            # -------- STEP 1: Load Data --------
+            logger.info("STEP 1: Loading Chicago crime data...")
+            df = load_data(raw_path)
+            logger.info(f"✓ Original dataset shape: {df.shape}")
+        
+            # -------- STEP 2: Clean Data --------
+            logger.info("STEP 2: Cleaning and preprocessing data...")
+            df = clean_data(df)
+            logger.info(f"✓ After cleaning shape: {df.shape}")
+        
+            # ✨ SAVE PROCESSED DATA ✨
+            save_processed(df, PROCESSED_DATA_PATH)
+            logger.info(f"✓ Cleaned data saved to {PROCESSED_DATA_PATH}")
+    
+        # -------- STEP 3: Dashboard Filter Indexes --------
+        logger.info("STEP 3: Building bitmap filter indexes for the dashboard...")
+        save_filter_index(build_filter_index(df))
+        logger.info("✓ Filter index saved to data/processed/filter_index.npz")
+        
+        # -------- STEP 4: Spatio-temporal Count Tensor --------
+        logger.info("STEP 4: Building (or updating) the cell × hour-of-week × week × crime type count tensor...")
+        tensor = refresh_count_tensor(df)
+        save_count_tensor(tensor)
+        logger.info(f"✓ Count tensor shape: {tensor['counts'].shape}, non-zero bins: {tensor['counts'].nnz:,}")
+    
+        # -------- STEP 5: Patrol Allocation --------
+        logger.info("STEP 5: Allocating 25 patrol units per shift over the last 52 weeks of hotspots...")
+        hourly_counts = hourly_cell_counts(tensor, weeks=slice(-52, None))
+        patrol_plan = plan_shifts(cell_centers(tensor), hourly_counts, n_units=25)
+    
+        os.makedirs("outputs", exist_ok=True)
+        with open("outputs/patrol_plan.json", 'w') as f:
+            json.dump(patrol_plan, f, indent=4)
+        logger.info("✓ Patrol plan saved to outputs/patrol_plan.json")
+    
+        # -------- STEP 6: Sample Data --------
+        logger.info("STEP 6: Sampling 50,000 records for processing...")
+        df_sample = df.sample(n=50000, random_state=42) if len(df) > 50000 else df
+        logger.info(f"✓ Sampled dataset shape: {df_sample.shape}")
+    
+        # -------- STEP 7: Feature Selection --------
+        logger.info("STEP 7: Selecting features for clustering...")
+        X = select_features(df_sample)
+        logger.info(f"✓ Features selected: {X.columns.tolist()}")
+        logger.info(f"✓ Feature matrix shape: {X.shape}")
+    
+        # -------- STEP 8: Feature Scaling --------
+        logger.info("STEP 8: Scaling features...")
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        logger.info("✓ Features scaled successfully")
+    
+        # -------- STEP 9: Dimensionality Reduction (PCA) --------
+        logger.info("STEP 9: Applying PCA for feature reduction...")
+        X_pca, explained_var, pca_model = apply_pca(X_scaled, n_components=3)
+    
+        feature_importance = get_feature_importance(pca_model, X.columns.tolist())
+        logger.info(f"✓ PCA completed. Explained variance: {np.cumsum(explained_var)[-1]:.4f}")
+        logger.info(f"✓ Top 5 Important Features: {list(feature_importance.items())[:5]}")
+    
+        # Save PCA results
+        save_dimensionality_results(X_pca, explained_var, feature_importance)
+    
+        # -------- STEP 10: K-Means Clustering --------
+        logger.info("STEP 10: Training K-Means clustering models...")
+    
+        kmeans_results = []
+        best_kmeans_k = None
+        best_kmeans_score = -1
+    
+        for k in range(3, 11):
+            logger.info(f"  Testing K-Means with K={k}...")
+        
+            with mlflow.start_run(nested=True):
+                labels, score = kmeans_cluster(X_scaled, k=k)
             
-            mlflow.log_param("algorithm", "kmeans")
-            mlflow.log_param("clusters", k)
-            mlflow.log_metric("silhouette_score", score)
+                mlflow.log_param("algorithm", "kmeans")
+                mlflow.log_param("clusters", k)
+                mlflow.log_metric("silhouette_score", score)
             
-            # Calculate Davies-Bouldin Index
-            db_score = davies_bouldin_score(X_scaled, labels)
-            mlflow.log_metric("davies_bouldin_score", db_score)
+                # Calculate Davies-Bouldin Index
+                db_score = davies_bouldin_score(X_scaled, labels)
+                mlflow.log_metric("davies_bouldin_score", db_score)
             
-            logger.info(f"  ✓ K={k}: Silhouette={score:.4f}, Davies-Bouldin={db_score:.4f}")
+                logger.info(f"  ✓ K={k}: Silhouette={score:.4f}, Davies-Bouldin={db_score:.4f}")
             
-            kmeans_results.append({
-                "k": k,
-                "silhouette_score": float(score),
-                "davies_bouldin_score": float(db_score)
-            })
+                kmeans_results.append({
+                    "k": k,
+                    "silhouette_score": float(score),
+                    "davies_bouldin_score": float(db_score)
+                })
             
-            if score > best_kmeans_score:
-                best_kmeans_score = score
-                best_kmeans_k = k
+                if score > best_kmeans_score:
+                    best_kmeans_score = score
+                    best_kmeans_k = k
     
-    logger.info(f"✓ Best K-Means: K={best_kmeans_k}, Score={best_kmeans_score:.4f}")
+        logger.info(f"✓ Best K-Means: K={best_kmeans_k}, Score={best_kmeans_score:.4f}")
     
-    # -------- STEP 8: DBSCAN Clustering --------
-    logger.info("STEP 8: Training DBSCAN clustering...")
+        # -------- STEP 11: Bootstrap Stability --------
+        logger.info(f"STEP 11: Bootstrap stability analysis for K={best_kmeans_k} ({N_BOOTSTRAP} replicates)...")
     
-    with mlflow.start_run(nested=True):
-        dbscan_labels = dbscan_cluster(X_scaled)
-        
-        # Filter out noise points (-1 label) for silhouette calculation
-        mask = dbscan_labels != -1
-        if np.sum(mask) > 1:
-            db_score_dbscan = silhouette_score(X_scaled[mask], dbscan_labels[mask])
-        else:
-            db_score_dbscan = -1
+        with mlflow.start_run(nested=True):
+            stability = bootstrap_stability(X_scaled, best_kmeans_k, n_boot=N_BOOTSTRAP)
+            save_stability_results(stability)
         
-        mlflow.log_param("algorithm", "dbscan")
-        mlflow.log_param("eps", 0.01)
-        mlflow.log_param("min_samples", 50)
-        mlflow.log_metric("silhouette_score", db_score_dbscan)
-        mlflow.log_metric("n_clusters", len(set(dbscan_labels)) - (1 if -1 in dbscan_labels else 0))
+            mlflow.log_param("algorithm", "kmeans_bootstrap")
+            mlflow.log_param("clusters", best_kmeans_k)
+            mlflow.log_param("n_bootstrap", N_BOOTSTRAP)
+            mlflow.log_metric("ari_mean", stability["ari_mean"])
+            mlflow.log_metric("ari_std", stability["ari_std"])
+            mlflow.log_metric("min_cluster_jaccard", min(c["jaccard_mean"] for c in stability["clusters"]))
         
-        logger.info(f"✓ DBSCAN: Silhouette={db_score_dbscan:.4f}")
+            logger.info(f"✓ Stability: ARI={stability['ari_mean']:.4f} ± {stability['ari_std']:.4f}")
     
-    # -------- STEP 9: Hierarchical Clustering --------
-    logger.info("STEP 9: Training Hierarchical clustering...")
+        # -------- STEP 12: DBSCAN Parameter Sweep --------
+        logger.info("STEP 12: Sweeping DBSCAN parameters on a cached neighbour graph...")
     
-    from sklearn.cluster import AgglomerativeClustering
+        dbscan_sweep_results = []
+        best_dbscan = {"eps": None, "min_samples": None, "silhouette_score": -1, "n_clusters": 0}
     
-    with mlflow.start_run(nested=True):
-        hierarchical = AgglomerativeClustering(n_clusters=5, linkage='ward')
-        hier_labels = hierarchical.fit_predict(X_scaled)
-        hier_score = silhouette_score(X_scaled, hier_labels)
+        for eps, min_samples, dbscan_labels in dbscan_sweep(X_scaled, DBSCAN_EPS_VALUES, DBSCAN_MIN_SAMPLES_VALUES):
+            with mlflow.start_run(nested=True):
+                n_clusters = len(set(dbscan_labels)) - (1 if -1 in dbscan_labels else 0)
+                noise_ratio = float(np.mean(dbscan_labels == -1))
+            
+                # Filter out noise points (-1 label) for silhouette calculation
+                mask = dbscan_labels != -1
+                if n_clusters > 1:
+                    db_score_dbscan = silhouette_score(
+                        X_scaled[mask], dbscan_labels[mask],
+                        sample_size=min(10000, int(np.sum(mask))), random_state=42
+                    )
+                else:
+                    db_score_dbscan = -1
+            
+                mlflow.log_param("algorithm", "dbscan")
+                mlflow.log_param("eps", eps)
+                mlflow.log_param("min_samples", min_samples)
+                mlflow.log_metric("silhouette_score", db_score_dbscan)
+                mlflow.log_metric("n_clusters", n_clusters)
+                mlflow.log_metric("noise_ratio", noise_ratio)
+            
+                logger.info(f"  ✓ eps={eps}, min_samples={min_samples}: Silhouette={db_score_dbscan:.4f}, "
+                            f"Clusters={n_clusters}, Noise={noise_ratio:.1%}")
+            
+                dbscan_sweep_results.append({
+                    "eps": eps,
+                    "min_samples": min_samples,
+                    "silhouette_score": float(db_score_dbscan),
+                    "n_clusters": n_clusters,
+                    "noise_ratio": noise_ratio
+                })
+            
+                if db_score_dbscan > best_dbscan["silhouette_score"]:
+                    best_dbscan = dbscan_sweep_results[-1]
+    
+        db_score_dbscan = best_dbscan["silhouette_score"]
+        logger.info(f"✓ Best DBSCAN: eps={best_dbscan['eps']}, min_samples={best_dbscan['min_samples']}, "
+                    f"Silhouette={db_score_dbscan:.4f}")
+    
+        # -------- STEP 13: Hierarchical Clustering --------
+        logger.info("STEP 13: Training Hierarchical clustering...")
+    
+        from sklearn.cluster import AgglomerativeClustering
+    
+        with mlflow.start_run(nested=True):
+            hierarchical = AgglomerativeClustering(n_clusters=5, linkage='ward')
+            hier_labels = hierarchical.fit_predict(X_scaled)
+            hier_score = silhouette_score(X_scaled, hier_labels)
         
-        mlflow.log_param("algorithm", "hierarchical")
-        mlflow.log_param("linkage", "ward")
-        mlflow.log_metric("silhouette_score", hier_score)
+            mlflow.log_param("algorithm", "hierarchical")
+            mlflow.log_param("linkage", "ward")
+            mlflow.log_metric("silhouette_score", hier_score)
         
-        logger.info(f"✓ Hierarchical: Silhouette={hier_score:.4f}")
+            logger.info(f"✓ Hierarchical: Silhouette={hier_score:.4f}")
     
-    # -------- STEP 10: Save Results --------
-    logger.info("STEP 10: Saving clustering results...")
+        # -------- STEP 14: Save Results --------
+        logger.info("STEP 14: Saving clustering results...")
     
-    os.makedirs("outputs", exist_ok=True)
+        os.makedirs("outputs", exist_ok=True)
     
-    results = {
-        "dataset_info": {
-            "original_shape": str(df.shape),
-            "features": X.columns.tolist()
-        },
-        "kmeans_results": kmeans_results,
-        "best_kmeans": {
-            "k": int(best_kmeans_k),
-            "silhouette_score": float(best_kmeans_score)
-        },
-        "dbscan_results": {
-            "silhouette_score": float(db_score_dbscan)
-        },
-        "hierarchical_results": {
-            "silhouette_score": float(hier_score)
-        },
-        "feature_importance": feature_importance
-    }
+        results = {
+            "dataset_info": {
+                "original_shape": str(df_sample.shape),
+                "features": X.columns.tolist()
+            },
+            "kmeans_results": kmeans_results,
+            "best_kmeans": {
+                "k": int(best_kmeans_k),
+                "silhouette_score": float(best_kmeans_score)
+            },
+            "stability": {
+                "k": int(best_kmeans_k),
+                "ari_mean": stability["ari_mean"],
+                "ari_std": stability["ari_std"],
+                "cluster_jaccard": [c["jaccard_mean"] for c in stability["clusters"]]
+            },
+            "dbscan_results": {
+                "silhouette_score": float(db_score_dbscan),
+                "eps": best_dbscan["eps"],
+                "min_samples": best_dbscan["min_samples"],
+                "n_clusters": best_dbscan["n_clusters"]
+            },
+            "dbscan_sweep": dbscan_sweep_results,
+            "hierarchical_results": {
+                "silhouette_score": float(hier_score)
+            },
+            "feature_importance": feature_importance
+        }
     
-    with open("outputs/clustering_results.json", 'w') as f:
-        json.dump(results, f, indent=4)
+        with open("outputs/clustering_results.json", 'w') as f:
+            json.dump(results, f, indent=4)
     
-    logger.info("✓ Results saved to outputs/clustering_results.json")
+        logger.info("✓ Results saved to outputs/clustering_results.json")
     
-    # -------- STEP 11: Register Model --------
-    logger.info("STEP 11: Registering best model in MLflow...")
+        # -------- STEP 15: Register Model --------
+        logger.info("STEP 15: Registering best model in MLflow...")
     
-    with mlflow.start_run(run_name="best_kmeans_model"):
-        labels, score = kmeans_cluster(X_scaled, k=best_kmeans_k)
+        with mlflow.start_run(run_name="best_kmeans_model"):
+            best_model = kmeans_fit(X_scaled, k=best_kmeans_k)
+            score = silhouette_score(X_scaled, best_model.labels_)
         
-        mlflow.log_param("algorithm", "kmeans")
-        mlflow.log_param("clusters", best_kmeans_k)
-        mlflow.log_metric("silhouette_score", score)
-        mlflow.log_artifact("outputs/clustering_results.json")
+            mlflow.log_param("algorithm", "kmeans")
+            mlflow.log_param("clusters", best_kmeans_k)
+            mlflow.log_param("random_state", best_model.random_state)
+            mlflow.log_param("n_init", best_model.n_init)
+            mlflow.log_metric("silhouette_score", score)
+            mlflow.log_metric("davies_bouldin_score", davies_bouldin_score(X_scaled, best_model.labels_))
+            mlflow.log_artifact("outputs/clustering_results.json")
+        
+            # Register scaler + K-Means together so the model scores raw features
+            mlflow.sklearn.log_model(
+                Pipeline([("scaler", scaler), ("kmeans", best_model)]),
+                artifact_path="model",
+                registered_model_name=REGISTERED_MODEL_NAME
+            )
+        
+            logger.info(f"✓ Best model registered in MLflow as {REGISTERED_MODEL_NAME}")
         
-        logger.info("✓ Best model registered in MLflow")
+            # -------- STEP 16: Cluster Profiles --------
+            logger.info(f"STEP 16: Profiling {best_kmeans_k} clusters on the full dataset...")
+            full_labels = assign_clusters(df, scaler, best_model)
+            profiles = profile_clusters(df, full_labels, best_kmeans_k)
+            save_cluster_profiles(profiles)
+            mlflow.log_artifact("outputs/cluster_profiles.json")
+        
+            logger.info(f"✓ Profiles computed for {len(df):,} records")
     
-    logger.info("="*80)
-    logger.info("✓ PIPELINE COMPLETED SUCCESSFULLY!")
-    logger.info("="*80)
-    logger.info("")
-    logger.info("📊 FILES CREATED:")
-    logger.info("  ✓ data/processed/crime_cleaned.csv")
-    logger.info("  ✓ outputs/clustering_results.json")
-    logger.info("  ✓ outputs/pca_results.json")
-    logger.info("  ✓ logs/training_*.log")
-    logger.info("")
-    logger.info("📊 NEXT STEPS:")
-    logger.info("1. View MLflow experiments:")
-    logger.info("   mlflow ui")
-    logger.info("")
-    logger.info("2. Start Streamlit dashboard (in another terminal):")
-    logger.info("   streamlit run app/Home.py")
-    logger.info("")
-    logger.info("="*80)
+        # -------- STEP 17: Hotspot Drift --------
+        logger.info(f"STEP 17: Tracking {best_kmeans_k} hotspots over {DRIFT_WINDOW_DAYS}-day windows...")
+    
+        with mlflow.start_run(run_name="hotspot_drift"):
+            drift = track_hotspot_drift(
+                df, best_kmeans_k, window_days=DRIFT_WINDOW_DAYS, step_days=DRIFT_STEP_DAYS
+            )
+            save_drift_results(drift)
+        
+            mlflow.log_param("window_days", DRIFT_WINDOW_DAYS)
+            mlflow.log_param("step_days", DRIFT_STEP_DAYS)
+            mlflow.log_metric("n_windows", drift["n_windows"])
+            mlflow.log_metric("births", drift["summary"]["births"])
+            mlflow.log_metric("deaths", drift["summary"]["deaths"])
+            mlflow.log_artifact("outputs/hotspot_drift.json")
+        
+            logger.info(f"✓ {drift['n_windows']} windows: {drift['summary']['births']} births, "
+                        f"{drift['summary']['deaths']} deaths")
     
-except Exception as e:
-    logger.error(f"❌ ERROR in training pipeline: {str(e)}", exc_info=True)
-    raise
\ No newline at end of file
+        logger.info("="*80)
+        logger.info("✓ PIPELINE COMPLETED SUCCESSFULLY!")
+        logger.info("="*80)
+        logger.info("")
+        logger.info("📊 FILES CREATED:")
+        logger.info("  ✓ data/processed/crime_cleaned.csv")
+        logger.info("  ✓ data/processed/filter_index.npz")
+        logger.info("  ✓ data/processed/crime_tensor.npz")
+        logger.info("  ✓ outputs/clustering_results.json")
+        logger.info("  ✓ outputs/pca_results.json")
+        logger.info("  ✓ outputs/patrol_plan.json")
+        logger.info("  ✓ outputs/stability_results.json")
+        logger.info("  ✓ outputs/cluster_profiles.json")
+        logger.info("  ✓ outputs/hotspot_drift.json")
+        logger.info("  ✓ logs/training_*.log")
+        logger.info("")
+        logger.info("📊 NEXT STEPS:")
+        logger.info("1. View MLflow experiments:")
+        logger.info("   mlflow ui")
+        logger.info("")
+        logger.info("2. Start Streamlit dashboard (in another terminal):")
+        logger.info("   streamlit run app/Home.py")
+        logger.info("")
+        logger.info("="*80)
+    
+    except Exception as e:
+        logger.error(f"❌ ERROR in training pipeline: {str(e)}", exc_info=True)
+        raise
+
+
+if __name__ == "__main__":
+    from src.cli import main
+    main(["train"])
@@ -0,0 +1,62 @@
+# tests/test_clustering.py
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+
+from src.clustering import radius_neighbor_graph, dbscan_from_graph, dbscan_sweep
+
+EPS_VALUES = [0.2, 0.35, 0.5]
+MIN_SAMPLES_VALUES = [3, 10, 25]
+
+
+@pytest.fixture(scope="module")
+def points():
+    X, _ = make_blobs(n_samples=600, centers=4, cluster_std=0.4, random_state=0)
+    rng = np.random.default_rng(0)
+    noise = rng.uniform(X.min(axis=0), X.max(axis=0), size=(60, 2))
+    # Exact duplicates exercise zero-distance edges
+    return np.vstack([X, noise, X[:40]])
+
+
+def _assert_matches_sklearn(X, labels, eps, min_samples):
+    reference = DBSCAN(eps=eps, min_samples=min_samples).fit(X)
+    core = np.zeros(len(X), dtype=bool)
+    core[reference.core_sample_indices_] = True
+
+    # Same noise points and the same partition of the core points
+    np.testing.assert_array_equal(labels == -1, reference.labels_ == -1)
+    assert adjusted_rand_score(reference.labels_[core], labels[core]) == 1.0
+
+    # A border point reachable from several clusters may join any of them
+    # (sklearn picks by expansion order); it must join a neighbouring core point's
+    dist = np.linalg.norm(X[:, None] - X[None, :], axis=2)
+    for i in np.flatnonzero(~core & (labels != -1)):
+        neighbours = core & (dist[i] <= eps)
+        assert labels[i] in labels[neighbours]
+
+
+@pytest.mark.parametrize("eps", EPS_VALUES)
+@pytest.mark.parametrize("min_samples", MIN_SAMPLES_VALUES)
+def test_dbscan_from_graph_matches_sklearn(points, eps, min_samples):
+    graph = radius_neighbor_graph(points, max(EPS_VALUES))
+    labels = dbscan_from_graph(graph, eps, min_samples)
+    _assert_matches_sklearn(points, labels, eps, min_samples)
+
+
+def test_dbscan_from_graph_all_noise(points):
+    graph = radius_neighbor_graph(points, 0.01)
+    assert (dbscan_from_graph(graph, 0.01, len(points) + 1) == -1).all()
+
+
+def test_dbscan_sweep_covers_grid(points):
+    sweep = dbscan_sweep(points, EPS_VALUES, MIN_SAMPLES_VALUES)
+    assert [(eps, m) for eps, m, _ in sweep] == [(e, m) for e in EPS_VALUES for m in MIN_SAMPLES_VALUES]
+    for eps, min_samples, labels in sweep:
+        _assert_matches_sklearn(points, labels, eps, min_samples)
+
+
+def test_dbscan_sweep_rejects_unknown_method(points):
+    with pytest.raises(ValueError):
+        dbscan_sweep(points, EPS_VALUES, MIN_SAMPLES_VALUES, method="brute")
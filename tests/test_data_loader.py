@@ -0,0 +1,62 @@
+# tests/test_data_loader.py
+import filecmp
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import load_data, save_processed, load_processed, parallel_ingest
+from src.preprocessing import clean_data
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    """Small raw export with the messy rows the cleaner has to handle"""
+    rng = np.random.default_rng(0)
+    n = 400
+    dates = pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 3000 * 24 * 3600, n), unit="s")
+    df = pd.DataFrame({
+        "ID": np.arange(n),
+        "Case Number": [f"JA{i:06d}" for i in range(n)],
+        "Date": dates.strftime("%m/%d/%Y %I:%M:%S %p"),
+        "Block": "001XX N STATE ST",
+        "IUCR": "0820",
+        "Primary Type": rng.choice(["THEFT", "BATTERY", "NARCOTICS"], n),
+        "Description": "$500 AND UNDER",
+        "Location Description": rng.choice(["STREET", "RESIDENCE", ""], n),
+        "Arrest": rng.choice(["true", "false"], n),
+        "Domestic": rng.choice(["true", "false"], n),
+        "Beat": rng.integers(100, 2500, n),
+        "District": rng.integers(1, 26, n),
+        "Ward": pd.array(rng.integers(1, 51, n), dtype="Int64"),
+        "Community Area": rng.integers(1, 78, n),
+        "FBI Code": "06",
+        "X Coordinate": rng.uniform(1.1e6, 1.2e6, n),
+        "Y Coordinate": rng.uniform(1.8e6, 1.95e6, n),
+        "Year": dates.year,
+        "Updated On": "02/10/2018 03:50:01 PM",
+        "Latitude": rng.uniform(41.65, 42.0, n),
+        "Longitude": rng.uniform(-87.9, -87.55, n),
+        "Location": ""
+    })
+    df.loc[::37, "Ward"] = pd.NA
+    df.loc[::53, ["Latitude", "Longitude"]] = np.nan
+    df.loc[7, "Date"] = "2016-03-04 05:06:07"     # needs the element-wise fallback
+    df.loc[11, "Date"] = "not a date"
+
+    path = tmp_path / "raw.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_parallel_ingest_matches_serial(raw_csv, tmp_path):
+    serial_path = tmp_path / "serial.csv"
+    parallel_path = tmp_path / "parallel.csv"
+
+    save_processed(clean_data(load_data(raw_csv)), str(serial_path))
+    stats = parallel_ingest(str(raw_csv), str(parallel_path), n_workers=2, chunk_bytes=4096)
+
+    assert stats["chunks"] > 2
+    assert stats["raw_rows"] == 400
+    assert filecmp.cmp(serial_path, parallel_path, shallow=False)
+    assert len(load_processed(str(parallel_path))) == stats["clean_rows"]
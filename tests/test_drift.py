@@ -0,0 +1,73 @@
+# tests/test_drift.py
+import numpy as np
+import pandas as pd
+
+from src.drift import _WindowState, track_hotspot_drift
+
+HOTSPOTS = {"A": (41.88, -87.63), "B": (41.78, -87.70), "C": (41.95, -87.75)}
+
+
+def _incidents(rng, centre, start, end, n, spread=0.004):
+    days = (pd.Timestamp(end) - pd.Timestamp(start)).days
+    return pd.DataFrame({
+        "Date": pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days * 24, n), unit="h"),
+        "Latitude": rng.normal(centre[0], spread, n),
+        "Longitude": rng.normal(centre[1], spread, n)
+    })
+
+
+def test_empty_slot_does_not_attract_points():
+    points = np.array([[0.0, 0.0], [0.1, 0.0], [10.0, 0.0], [10.1, 0.0]])
+    state = _WindowState(points)
+    state.new_slots(np.array([[0.0, 0.0], [5.0, 5.0], [10.0, 0.0]]))
+    state.reassign(slice(0, 4))
+
+    assert state.counts.tolist() == [2, 0, 2]
+    labels, sq_dist = state.nearest(slice(0, 4))
+    assert labels.tolist() == [0, 0, 2, 2]
+    assert np.isfinite(sq_dist).all()
+
+
+def test_nearest_skips_dead_slots():
+    points = np.array([[0.0, 0.0], [10.0, 0.0], [20.0, 0.0]])
+    state = _WindowState(points)
+    state.new_slots(np.array([[0.0, 0.0], [10.0, 0.0], [20.0, 0.0], [0.5, 0.0]]))
+    state.alive[[0, 2]] = False
+
+    labels, sq_dist = state.nearest(slice(0, 3))
+    assert labels.tolist() == [3, 1, 1]
+    np.testing.assert_allclose(sq_dist, [0.25, 0.0, 100.0])
+
+
+def test_tracks_fading_hotspot():
+    rng = np.random.default_rng(0)
+    df = pd.concat([
+        _incidents(rng, HOTSPOTS["A"], "2019-01-01", "2020-01-01", 4000),
+        _incidents(rng, HOTSPOTS["B"], "2019-01-01", "2020-01-01", 4000),
+        _incidents(rng, HOTSPOTS["C"], "2019-01-01", "2019-06-01", 1600)
+    ], ignore_index=True)
+
+    results = track_hotspot_drift(df, n_clusters=3, window_days=60, step_days=7)
+    tracks = pd.DataFrame(results["tracks"])
+
+    assert tracks[["latitude", "longitude"]].notna().all().all()
+    deaths = [e for e in results["events"] if e["event"] == "death"]
+    assert len(deaths) == 1
+    assert abs(deaths[0]["latitude"] - HOTSPOTS["C"][0]) < 0.01
+    assert "2019-06-01" <= deaths[0]["window_end"] <= "2019-08-15"
+
+
+def test_restarts_after_gap_in_data():
+    rng = np.random.default_rng(1)
+    df = pd.concat([
+        _incidents(rng, HOTSPOTS[name], start, end, 1500)
+        for name in ("A", "B")
+        for start, end in [("2019-01-01", "2019-04-01"), ("2019-09-01", "2019-12-01")]
+    ], ignore_index=True)
+
+    results = track_hotspot_drift(df, n_clusters=2, window_days=30, step_days=7)
+    tracks = pd.DataFrame(results["tracks"])
+
+    assert tracks[["latitude", "longitude"]].notna().all().all()
+    assert results["summary"]["deaths"] == 2
+    assert results["summary"]["births"] == 4
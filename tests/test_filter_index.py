@@ -0,0 +1,87 @@
+# tests/test_filter_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.filter_index import (
+    build_filter_index, query_filter_index, save_filter_index, load_filter_index, data_fingerprint
+)
+
+
+@pytest.fixture(scope="module")
+def crimes():
+    rng = np.random.default_rng(0)
+    n = 5003    # not a multiple of 8, so the packed bitmaps have padding bits
+    df = pd.DataFrame({
+        "ID": rng.permutation(n),
+        "Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 365 * 24, n), unit="h"),
+        "Primary Type": rng.choice(["THEFT", "BATTERY", "ASSAULT", "NARCOTICS"], n),
+        "District": pd.array(rng.integers(1, 8, n), dtype="Int64"),
+        "Arrest": rng.random(n) < 0.3
+    })
+    df.loc[::97, "District"] = pd.NA
+    df.loc[::131, "Date"] = pd.NaT
+    return df
+
+
+def _scan(df, filters, start=None, end=None):
+    mask = np.ones(len(df), dtype=bool)
+    for column, selected in filters.items():
+        if selected:
+            mask &= df[column].astype(str).isin([str(v) for v in selected]).values
+    if start is not None:
+        mask &= (df["Date"] >= start).values
+    if end is not None:
+        mask &= (df["Date"] < end).values
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize("filters, start, end", [
+    ({}, None, None),
+    ({"Primary Type": ["THEFT"]}, None, None),
+    ({"Primary Type": ["THEFT", "BATTERY"], "District": [3, 5]}, None, None),
+    ({"District": ["2"], "Arrest": ["True"]}, "2020-03-01", "2020-06-01"),
+    ({"Arrest": ["False"]}, None, "2020-02-15"),
+    ({"Primary Type": ["HOMICIDE"]}, None, None),
+    ({"Primary Type": [], "District": None}, "2020-12-01", None),
+])
+def test_query_matches_scan(crimes, filters, start, end):
+    index = build_filter_index(crimes)
+    start = None if start is None else pd.Timestamp(start)
+    end = None if end is None else pd.Timestamp(end)
+
+    expected = _scan(crimes, filters, start, end) if filters or start or end else np.arange(len(crimes))
+    np.testing.assert_array_equal(query_filter_index(index, filters, start, end), expected)
+
+
+def test_save_load_round_trip(crimes, tmp_path):
+    index = build_filter_index(crimes)
+    save_filter_index(index, str(tmp_path))
+    loaded = load_filter_index(str(tmp_path))
+
+    assert loaded["fingerprint"] == data_fingerprint(crimes)
+    filters = {"Primary Type": ["ASSAULT"], "Arrest": ["True"]}
+    np.testing.assert_array_equal(
+        query_filter_index(loaded, filters, pd.Timestamp("2020-05-01")),
+        query_filter_index(index, filters, pd.Timestamp("2020-05-01"))
+    )
+
+
+def test_fingerprint_detects_changed_rows(crimes):
+    fingerprint = data_fingerprint(crimes)
+    assert data_fingerprint(crimes.copy()) == fingerprint
+
+    # Same row count, different incidents / order
+    replaced = crimes.copy()
+    replaced.loc[0, "ID"] = len(crimes) + 1
+    assert data_fingerprint(replaced) != fingerprint
+    assert data_fingerprint(crimes.iloc[::-1]) != fingerprint
+
+
+@pytest.mark.parametrize("date_format", ["%Y-%m-%d %H:%M:%S", "%m/%d/%Y %I:%M:%S %p"])
+def test_string_dates_parsed_with_known_formats(crimes, date_format):
+    parsed = build_filter_index(crimes)
+    as_text = build_filter_index(crimes.assign(Date=crimes["Date"].dt.strftime(date_format)))
+
+    np.testing.assert_array_equal(as_text["sorted_dates"], parsed["sorted_dates"])
+    np.testing.assert_array_equal(as_text["date_order"], parsed["date_order"])
@@ -0,0 +1,52 @@
+# tests/test_patrol.py
+import numpy as np
+import pytest
+
+from src.patrol import allocate_patrols, exact_allocation, haversine_matrix, plan_shifts, SHIFTS
+
+
+def _instance(seed, n_cells=12):
+    rng = np.random.default_rng(seed)
+    points = np.column_stack([rng.uniform(41.70, 42.00, n_cells), rng.uniform(-87.85, -87.55, n_cells)])
+    weights = rng.integers(1, 50, n_cells).astype(float)
+    return points, weights
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("n_units", [2, 3, 4])
+def test_heuristic_matches_exact(seed, n_units):
+    points, weights = _instance(seed)
+    dist = haversine_matrix(points)
+
+    heuristic = allocate_patrols(points, weights, n_units, dist=dist)
+    exact = exact_allocation(points, weights, n_units, dist=dist)
+
+    assert heuristic["cost"] == pytest.approx(exact["cost"], rel=1e-5)
+    assert heuristic["cost"] <= heuristic["greedy_cost"] + 1e-3
+
+
+def test_local_search_disabled():
+    points, weights = _instance(0)
+    plan = allocate_patrols(points, weights, 3, max_iter=0)
+    assert plan["local_search_iterations"] == 0
+    assert plan["cost"] == pytest.approx(plan["greedy_cost"])
+
+
+def test_plan_shifts_returns_cell_ids():
+    rng = np.random.default_rng(0)
+    points = np.column_stack([rng.uniform(41.70, 42.00, 60), rng.uniform(-87.85, -87.55, 60)])
+    hourly_counts = rng.poisson(1.0, (24, 60)).astype(float)
+    hourly_counts[:, ::3] = 0    # inactive cells are dropped before solving
+
+    plans = plan_shifts(points, hourly_counts, n_units=4)
+
+    assert set(plans) == set(SHIFTS)
+    for plan in plans.values():
+        assert len(plan["units"]) == 4
+        assert all(u % 3 != 0 for u in plan["units"])
+        np.testing.assert_allclose(points[plan["units"]], plan["unit_locations"])
+
+
+def test_plan_shifts_without_active_cells():
+    points = np.zeros((5, 2))
+    assert plan_shifts(points, np.zeros((24, 5)), n_units=2) == {}
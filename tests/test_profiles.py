@@ -0,0 +1,70 @@
+# tests/test_profiles.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.profiles import _peak_windows, profile_clusters
+
+
+@pytest.fixture
+def crimes():
+    rng = np.random.default_rng(0)
+    n = 3000
+    df = pd.DataFrame({
+        "Primary Type": rng.choice(["THEFT", "BATTERY", "ASSAULT", "NARCOTICS"], n, p=[0.4, 0.3, 0.2, 0.1]),
+        "Hour": rng.integers(0, 24, n),
+        "Arrest": rng.random(n) < 0.25,
+        "Domestic": rng.random(n) < 0.15,
+        "Latitude": rng.uniform(41.7, 42.0, n),
+        "Longitude": rng.uniform(-87.85, -87.55, n)
+    })
+    labels = rng.integers(0, 4, n)
+    labels[labels == 3] = 2     # cluster 3 stays empty
+    return df, labels
+
+
+def test_profiles_match_groupby(crimes):
+    df, labels = crimes
+    profiles = profile_clusters(df, labels, n_clusters=4)
+    grouped = df.groupby(labels)
+
+    assert [p["cluster"] for p in profiles] == [0, 1, 2, 3]
+    for c, group in grouped:
+        profile = profiles[c]
+        assert profile["crimes"] == len(group)
+        assert profile["share"] == pytest.approx(len(group) / len(df))
+        assert profile["arrest_rate"] == pytest.approx(group["Arrest"].mean())
+        assert profile["domestic_rate"] == pytest.approx(group["Domestic"].mean())
+        assert profile["centroid"]["latitude"] == pytest.approx(group["Latitude"].mean())
+        assert profile["centroid"]["longitude"] == pytest.approx(group["Longitude"].mean())
+        assert profile["hour_histogram"] == group["Hour"].value_counts().reindex(range(24), fill_value=0).tolist()
+
+        type_counts = group["Primary Type"].value_counts()
+        assert [t["type"] for t in profile["dominant_types"]] == type_counts.index[:3].tolist()
+        assert [t["count"] for t in profile["dominant_types"]] == type_counts.values[:3].tolist()
+
+
+def test_empty_cluster_profile(crimes):
+    df, labels = crimes
+    empty = profile_clusters(df, labels, n_clusters=4)[3]
+
+    assert empty["crimes"] == 0
+    assert empty["dominant_types"] == []
+    assert empty["arrest_rate"] == 0.0
+    assert sum(empty["hour_histogram"]) == 0
+
+
+def test_peak_window_wraps_midnight():
+    hist = np.zeros((2, 24))
+    hist[0, [22, 23, 0, 1, 2]] = 10     # busiest 8h window spans midnight
+    hist[1, 9:17] = 5
+
+    np.testing.assert_array_equal(_peak_windows(hist, 8), [19, 9])
+    profile = profile_clusters(
+        pd.DataFrame({
+            "Primary Type": "THEFT", "Hour": [22, 23, 0, 1, 2], "Arrest": False, "Domestic": False,
+            "Latitude": 41.9, "Longitude": -87.6
+        }),
+        np.zeros(5, dtype=np.int64), n_clusters=1, peak_width=4
+    )[0]
+    assert profile["peak_window"] == "10 PM - 2 AM"
@@ -0,0 +1,30 @@
+# tests/test_stability.py
+import numpy as np
+import pytest
+from sklearn.datasets import make_blobs
+
+from src.stability import align_centroids, bootstrap_stability
+
+
+def test_align_centroids_undoes_permutation():
+    rng = np.random.default_rng(0)
+    reference = rng.normal(size=(6, 3)) * 10
+    permutation = rng.permutation(6)
+    shuffled = reference[permutation] + rng.normal(scale=0.01, size=(6, 3))
+
+    np.testing.assert_allclose(align_centroids(reference, shuffled), reference, atol=0.1)
+
+
+def test_separated_blobs_are_stable():
+    X, _ = make_blobs(n_samples=600, centers=4, cluster_std=0.3, center_box=(-20, 20), random_state=0)
+
+    results = bootstrap_stability(X, k=4, n_boot=8, n_jobs=1, n_init=3)
+
+    assert results["n_bootstrap"] == 8
+    assert len(results["ari_values"]) == 8
+    assert results["ari_mean"] == pytest.approx(1.0, abs=1e-3)
+    assert sum(c["size"] for c in results["clusters"]) == len(X)
+    for cluster in results["clusters"]:
+        assert cluster["jaccard_mean"] == pytest.approx(1.0, abs=1e-3)
+        assert cluster["stable_fraction"] == 1.0
+        assert cluster["centroid_shift_mean"] < 0.2
@@ -0,0 +1,97 @@
+# tests/test_tensor.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.tensor import (
+    assign_grid_cells, build_count_tensor, update_count_tensor, refresh_count_tensor,
+    save_count_tensor, weekly_cell_counts, hourly_cell_counts, rolling_window_counts, _week_range
+)
+
+
+@pytest.fixture
+def crimes():
+    rng = np.random.default_rng(0)
+    n = 6000
+    df = pd.DataFrame({
+        "Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 400 * 24 * 60, n), unit="min"),
+        "Latitude": rng.uniform(41.70, 42.00, n),
+        "Longitude": rng.uniform(-87.85, -87.55, n),
+        "Primary Type": rng.choice(["BATTERY", "THEFT"], n)
+    }).sort_values("Date", ignore_index=True)
+    # A crime type that only shows up in the last rows
+    df.loc[df.index[-50:], "Primary Type"] = "ARSON"
+    return df
+
+
+def _assert_same_counts(tensor, expected):
+    assert sorted(tensor["crime_types"]) == sorted(expected["crime_types"])
+    assert tensor["counts"].shape == expected["counts"].shape
+    for crime_type in expected["crime_types"]:
+        diff = weekly_cell_counts(tensor, [crime_type]) - weekly_cell_counts(expected, [crime_type])
+        assert diff.nnz == 0
+
+
+def test_refresh_matches_full_build(crimes, tmp_path, capsys):
+    save_count_tensor(build_count_tensor(crimes.iloc[:4000]), str(tmp_path))
+
+    tensor = refresh_count_tensor(crimes, str(tmp_path))
+
+    assert "Updating saved count tensor with 2,000 incidents" in capsys.readouterr().out
+    assert tensor["n_incidents"] == len(crimes)
+    assert tensor["crime_types"][-1] == "ARSON"
+    _assert_same_counts(tensor, build_count_tensor(crimes))
+
+
+def test_update_in_batches_matches_full_build(crimes):
+    tensor = build_count_tensor(crimes.iloc[:1000])
+    for start in range(1000, len(crimes), 1000):
+        tensor = update_count_tensor(tensor, crimes.iloc[start:start + 1000])
+    _assert_same_counts(tensor, build_count_tensor(crimes))
+
+
+def test_changed_history_forces_rebuild(crimes, tmp_path, capsys):
+    save_count_tensor(build_count_tensor(crimes.iloc[:4000]), str(tmp_path))
+    capsys.readouterr()
+
+    # One early incident dropped: the rows up to the saved latest date no longer add up
+    changed = crimes.drop(index=10)
+    tensor = refresh_count_tensor(changed, str(tmp_path))
+
+    assert "Updating saved count tensor" not in capsys.readouterr().out
+    _assert_same_counts(tensor, build_count_tensor(changed))
+
+
+def test_hourly_counts_match_groupby(crimes):
+    tensor = build_count_tensor(crimes)
+    cells = assign_grid_cells(crimes["Latitude"], crimes["Longitude"])
+
+    expected = np.zeros((24, tensor["grid_shape"][0] * tensor["grid_shape"][1]), dtype=np.int64)
+    grouped = crimes.groupby([crimes["Date"].dt.hour, cells]).size()
+    expected[grouped.index.get_level_values(0), grouped.index.get_level_values(1)] = grouped.values
+
+    np.testing.assert_array_equal(hourly_cell_counts(tensor), expected)
+
+    theft = crimes["Primary Type"] == "THEFT"
+    grouped = crimes[theft].groupby(crimes.loc[theft, "Date"].dt.hour).size()
+    np.testing.assert_array_equal(hourly_cell_counts(tensor, ["THEFT"]).sum(axis=1), grouped.values)
+
+
+def test_rolling_window_counts(crimes):
+    tensor = build_count_tensor(crimes)
+    weekly = weekly_cell_counts(tensor).toarray()
+    rolling = rolling_window_counts(tensor, window=4)
+
+    np.testing.assert_array_equal(rolling[10], weekly[7:11].sum(axis=0))
+    np.testing.assert_array_equal(rolling[1], weekly[:2].sum(axis=0))
+
+
+def test_bad_arguments_rejected(crimes):
+    tensor = build_count_tensor(crimes)
+    with pytest.raises(ValueError):
+        rolling_window_counts(tensor, window=0)
+    with pytest.raises(ValueError):
+        _week_range(tensor, slice(0, 10, 2))
+    with pytest.raises(ValueError):
+        hourly_cell_counts(tensor, weeks=slice(None, None, -1))
+    assert _week_range(tensor, slice(-4, None))[1] - _week_range(tensor, slice(-4, None))[0] == 4